@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim: set sts=4 sw=4 et tw=0 :
+#
+# License:
+#  AGPL-3.0
+#  http://www.gnu.org/licenses/agpl-3.0.html
+#
+# Reads Bharati Braille back into the text of an Indic script, to check that
+# conversions by converters.py are right. See BackTranslator.
+#
+
+import re
+import sys
+from collections import namedtuple, OrderedDict
+from types import MappingProxyType
+
+if sys.version_info.major != 3:
+    raise Exception("This program needs Python 3!")
+
+from .mappings.common import ellipsis, number_prefix
+from .converters import CompositeTrie, script_converters, convert_many
+from .converters import char_class_of, CLASS_VOWEL_SIGN, CLASS_PUNCTUATION
+from .converters import cm_to_bb_punctuation, cm_to_bb_numbers
+from .converters import cm_to_bb_math_punctuation
+
+# A stretch of braille that converts back to more than one text: where it
+# starts in the braille, its cells, and the texts it can stand for, with the
+# one BackTranslator.translate() chose first
+Ambiguity = namedtuple("Ambiguity", "offset cells candidates")
+# Where a text and the braille it is checked against stop matching; see
+# BackTranslator.verify()
+Mismatch = namedtuple("Mismatch", "offset braille_offset")
+
+# Reading states of BackTranslator
+_AFTER_CONSONANT = 1
+_IN_NUMBER = 2
+# Only with _IN_NUMBER: the last character was a digit, or the next one
+# cannot be
+_AFTER_DIGIT = 4
+_NO_DIGIT = 8
+# A full stop that is not braille; a number cannot start with a digit right
+# after one, as the full stop would have been its decimal point
+_AFTER_POINT = 16
+# Only with _AFTER_CONSONANT, in verify(): a character that converts to
+# nothing came after the consonant. It kept the consonant apart from a
+# vowel letter, so no schwa was put in between; a vowel sign still follows
+# the consonant.
+_AFTER_SILENT = 32
+# The bits from here up number the start of a composite that has been read
+# a character at a time; see BackTranslator.prefixes
+_PENDING_SHIFT = 6
+
+# Kinds of reading; a vowel is only written as a sign after a consonant, and
+# only as a letter after a consonant if it follows an explicit schwa
+_LETTER = 0
+_VOWEL = 1
+_VOWEL_SIGN = 2
+
+class BackTranslator(object):
+    """
+    Reads Bharati Braille back into the text of a script, to check
+    conversions
+
+    The mappings are inverted into a CompositeTrie of cells, so that multi-
+    cell glyphs such as ⠐⠻, ⠲⠲, ⠤⠤⠤⠤ or ⠠⠠⠠ are found in one walk. The passes
+    of the conversion are undone as the braille is read: viramas are put
+    back after the cell in front of which they were moved, a schwa between
+    a consonant and a vowel is dropped, and digits are only read after a
+    number prefix.
+
+    Conversion loses information: क and क़ have the same cells, ⠦ is both ?
+    and “, and ⠼⠑ is 5, ५ and णे. translate() reports every stretch of
+    braille that can be read more than one way as an Ambiguity rather than
+    choosing silently, and verify() accepts a text if it is any of the
+    readings. Text that no conversion produces, such as a vowel sign without
+    a consonant or a virama at the start of a line, is not read back.
+
+    script is the name of a script in script_converters, or a
+    ScriptConverter. A BackTranslator can be shared between threads; all it
+    changes is a cache of how cells are read.
+    """
+
+    def __init__(self, script):
+        if isinstance(script, str):
+            script = script_converters[script]
+        self.plan = script
+        consonant_chars = script.consonant_chars
+        readings = OrderedDict()
+        def add(text, cells, kind):
+            after = _AFTER_CONSONANT if text[-1] in consonant_chars else 0
+            entry = readings.setdefault(cells, [])
+            if cells and (text, kind, after) not in entry:
+                entry.append((text, kind, after))
+        for (char, cells) in sorted(script.indic_to_bb.items()):
+            if char in script.vowel_chars:
+                add(char, cells, _VOWEL)
+            elif char_class_of(char) & CLASS_VOWEL_SIGN:
+                add(char, cells, _VOWEL_SIGN)
+            else:
+                add(char, cells, _LETTER)
+        # Nukta forms are read as the precomposed consonants
+        for (key, cells) in sorted(script.indic_to_bb_composite.items()):
+            if key not in script.nukta_forms:
+                add(key, cells, _LETTER)
+        for (char, cells) in cm_to_bb_punctuation.items():
+            add(char, cells, _LETTER)
+        # A fake ellipsis is converted to the cells of a real one
+        add("...", ellipsis, _LETTER)
+        self.trie = CompositeTrie(dict((cells, tuple(entry)) for
+                                       (cells, entry) in readings.items()
+                                       if entry))
+        digits = OrderedDict()
+        for (digit, cell) in cm_to_bb_numbers.items():
+            digits.setdefault(cell, []).append(digit)
+        self.digits = MappingProxyType(dict((cell, tuple(entry)) for
+                                            (cell, entry) in digits.items()))
+        self.comma = cm_to_bb_math_punctuation[","]
+        self.decimal_point = cm_to_bb_math_punctuation["."]
+        self.separator = cm_to_bb_punctuation[","]
+        self.number_breakers = frozenset(",.")
+        # [virama][any] -> [any][virama]; the reverse of virama_pattern
+        self.virama_pattern = re.compile(r"{0}(.)".format(
+                                         re.escape(script.virama)),
+                                         flags=re.MULTILINE)
+        self.virama_repl = r"\1{0}".format(script.virama)
+        # Where क, ् and ष are read from cells of their own, they must not
+        # make up क्ष, or the conversion would have used its cells instead;
+        # so the start of a composite that has been read is kept in the
+        # state, by its number in this tuple
+        composites = [key for key in script.indic_to_bb_composite
+                      if key not in script.nukta_forms]
+        self.prefixes = ("",) + tuple(sorted(set(
+            key[:length] for key in composites
+            for length in range(1, len(key)))))
+        self.prefix_states = dict((prefix, number << _PENDING_SHIFT) for
+                                  (number, prefix) in
+                                  enumerate(self.prefixes) if prefix)
+        # The most cells that a way of reading can look at: a schwa and the
+        # longest glyph, or a number prefix, a decimal point and a digit
+        self.window = max(len(script.schwa) + self.trie.max_length, 3)
+        self._cache = {}
+
+    def _undo_virama_reversal(self, braille):
+        """
+        Returns the braille with each virama back after the cell it was
+        moved in front of, and the offsets those cells are now at
+        """
+        if self.plan.virama not in braille:
+            return (braille, frozenset())
+        moved = frozenset(match.start() for match in
+                          self.virama_pattern.finditer(braille))
+        return (self.virama_pattern.sub(self.virama_repl, braille), moved)
+
+    @staticmethod
+    def _braille_offset(index, moved):
+        "Where the cell at index of the re-ordered braille was before that"
+        if index in moved:
+            return index + 1
+        if index - 1 in moved:
+            return index - 1
+        return index
+
+    def _steps(self, braille, index, state):
+        """
+        Returns (end, text, state) for each way of reading the braille from
+        index when in the given state: braille[index:end] stands for text,
+        and leaves the reader in the new state. The most likely ways come
+        first.
+        """
+        return [(index + length, text, next_state) for
+                (length, text, next_state) in self._lengths(braille, index,
+                                                            state)]
+
+    def _lengths(self, braille, index, state):
+        "Same as _steps(), but with the number of cells read instead of end"
+        # The same few cells come up again and again, so the ways of
+        # reading them are kept, by the cells that _read_steps() looks at
+        key = (braille[index:index+self.window], state)
+        try:
+            return self._cache[key]
+        except KeyError:
+            if len(self._cache) >= 65536:
+                self._cache.clear()
+            steps = self._cache[key] = self._read_steps(*key)
+            return steps
+
+    def _read_steps(self, cells, state):
+        "Same as _lengths(), for the start of cells"
+        steps = []
+        digits = self.digits
+        cell = cells[0]
+        if state & _IN_NUMBER:
+            if cell in digits and not state & _NO_DIGIT:
+                steps.extend((1, digit, _IN_NUMBER | _AFTER_DIGIT)
+                             for digit in digits[cell])
+            elif cell == self.comma or cell == self.decimal_point:
+                # Only written before a digit, which is read along with it
+                following = cells[1:2]
+                if following in digits and (cell == self.decimal_point or
+                                            state & _AFTER_DIGIT):
+                    point = "," if cell == self.comma else "."
+                    steps.extend((2, point + digit, _IN_NUMBER | _AFTER_DIGIT)
+                                 for digit in digits[following])
+            elif cell == self.separator:
+                # A comma between two digits would have been self.comma
+                steps.append((1, ",", _IN_NUMBER | (
+                              _NO_DIGIT if state & _AFTER_DIGIT else 0)))
+            elif cell == ".":
+                # So would a full stop before a digit
+                steps.append((1, ".", _IN_NUMBER | _NO_DIGIT))
+        elif cell == number_prefix:
+            (start, point) = (1, "")
+            if cells[1:2] == self.decimal_point and cells[2:3] in digits:
+                (start, point) = (2, ".")
+            following = cells[start:start+1]
+            if following in digits and (point or not state & _AFTER_POINT):
+                steps.extend((start + 1, point + digit,
+                              _IN_NUMBER | _AFTER_DIGIT)
+                             for digit in digits[following])
+        # Anything else ends a number; but not a comma or a full stop, which
+        # would have been part of it, or a virama, which would have been
+        # moved in front of the last digit
+        after_consonant = state & _AFTER_CONSONANT
+        (breakers, virama_starters) = ((self.number_breakers,
+                                        self.plan.virama_starters)
+                                       if state & _IN_NUMBER else ((), ()))
+        for (readings, end) in reversed(self.trie.matches(cells, 0)):
+            for (text, kind, after) in readings:
+                if text in breakers or text[0] in virama_starters:
+                    continue
+                if kind == _VOWEL and after_consonant and \
+                   not state & _AFTER_SILENT:
+                    # It would have been written after a schwa
+                    continue
+                if kind == _VOWEL_SIGN and not after_consonant:
+                    continue
+                steps.append((end, text, after))
+        schwa = self.plan.schwa
+        if after_consonant and not state & _AFTER_SILENT and \
+           cells.startswith(schwa):
+            for (readings, end) in reversed(self.trie.matches(cells,
+                                                              len(schwa))):
+                steps.extend((end, text, after)
+                             for (text, kind, after) in readings
+                             if kind == _VOWEL)
+        if not "⠀" <= cell <= "⣿" and cell not in breakers:
+            # Not braille; copied as-is by the conversion
+            if cell == ".":
+                steps.append((1, cell, _AFTER_POINT))
+            else:
+                steps.append((1, cell, _AFTER_CONSONANT
+                              if cell in self.plan.consonant_chars else 0))
+        prefix_states = self.prefix_states
+        if not prefix_states:
+            return steps
+        prefix = self.prefixes[state >> _PENDING_SHIFT]
+        checked = []
+        for (end, text, next_state) in steps:
+            if prefix:
+                if self.plan.composites.match(prefix + text, 0)[0]:
+                    continue
+                next_state |= (prefix_states.get(prefix + text) or
+                               prefix_states.get(text, 0))
+            else:
+                next_state |= prefix_states.get(text, 0)
+            checked.append((end, text, next_state))
+        return checked
+
+    def _readings(self, braille, index, end, state):
+        """
+        Returns (text, state) for each text braille[index:end] can stand
+        for from state, and the state it leaves the reader in
+        """
+        texts = []
+        pending = [(index, state, "")]
+        while pending:
+            (index, state, text) = pending.pop()
+            if index == end:
+                if (text, state) not in texts:
+                    texts.append((text, state))
+                continue
+            pending.extend((step_end, step_state, text + reading)
+                           for (step_end, reading, step_state)
+                           in reversed(self._steps(braille, index, state))
+                           if step_end <= end)
+        return texts
+
+    def translate(self, braille):
+        """
+        Returns (text, ambiguities): the text that the braille converts back
+        to, and an Ambiguity for each stretch of the braille that can also
+        be read as other text, in order. Where there is a choice the text
+        has the longest reading, and of those the first in the mappings.
+        Cells that stand for nothing are kept as they are, and reported as
+        an Ambiguity without any candidates.
+        """
+        (braille, moved) = self._undo_virama_reversal(braille)
+        length = len(braille)
+        # The ways of reading on from each (index, state) that is reached;
+        # every step moves forward in the braille
+        steps = {}
+        reached = {0: {0}}
+        furthest = 0
+        for index in range(length):
+            states = reached.pop(index, ())
+            for state in states:
+                found = steps[(index, state)] = self._steps(braille, index,
+                                                            state)
+                for (end, _, next_state) in found:
+                    reached.setdefault(end, set()).add(next_state)
+                    if end > furthest:
+                        furthest = end
+            if furthest <= index:
+                # No way of reading goes past here; the cell is kept as it
+                # is, and reading starts again after it
+                for state in states:
+                    steps[(index, state)].append((index + 1, None, 0))
+                reached.setdefault(index + 1, set()).add(0)
+                furthest = index + 1
+        # The fewest cells that have to be kept as they are from each (index,
+        # state) to the end, so that no reading is chosen that leads to
+        # cells that cannot be read
+        kept = {}
+        dead = length + 1
+        for config in sorted(steps, reverse=True):
+            fewest = dead
+            for (end, reading, next_state) in steps[config]:
+                fewest = min(fewest, kept.get((end, next_state), 0) +
+                             (reading is None))
+            kept[config] = fewest
+        text = []
+        ambiguities = []
+        (index, state) = (0, 0)
+        while index < length:
+            fewest = kept[(index, state)]
+            choices = [step for step in steps[(index, state)]
+                       if kept.get((step[0], step[2]), 0) +
+                       (step[1] is None) == fewest]
+            if choices[0][1] is None:
+                text.append(braille[index])
+                ambiguities.append(Ambiguity(
+                    self._braille_offset(index, moved), braille[index], ()))
+                (index, state) = (index + 1, 0)
+                continue
+            longest = max(step[0] for step in choices)
+            choices = [step for step in choices if step[0] == longest]
+            if len(choices) > 1 and not braille[longest:longest+1].strip():
+                # At the end of a word, ⠖ is more likely ! than फ
+                choices.sort(key=lambda step: not char_class_of(step[1][0]) &
+                             CLASS_PUNCTUATION)
+            (end, reading, next_state) = choices[0]
+            candidates = [reading]
+            if len(steps[(index, state)]) > 1 or end > index + 1:
+                # Only readings that leave the rest of the braille as
+                # readable
+                fewest = kept.get((end, next_state), 0)
+                for (other, other_state) in self._readings(braille, index,
+                                                           end, state):
+                    if other not in candidates and \
+                       kept.get((end, other_state), 0) == fewest:
+                        candidates.append(other)
+            if len(candidates) > 1:
+                ambiguities.append(Ambiguity(
+                    self._braille_offset(index, moved), braille[index:end],
+                    tuple(candidates)))
+            text.append(reading)
+            (index, state) = (end, next_state)
+        return ("".join(text), ambiguities)
+
+    def verify(self, text, braille):
+        """
+        Checks that the braille stands for the text: returns None if the
+        text is one of the ways of reading the braille back, or else a
+        Mismatch with how far into the text and into the braille they
+        matched. Nukta forms are composed first, and characters that
+        convert to nothing are skipped.
+        """
+        source = self.plan.canonicalise(text)
+        (silent_chars, consonant_chars) = (self.plan.silent_chars,
+                                           self.plan.consonant_chars)
+        def skip_silent(position, state):
+            # A silent character is still there until the charset is
+            # translated: no composite is matched across it, and an explicit
+            # schwa only goes after it if it is part of a consonant itself
+            while position < len(source) and source[position] in silent_chars:
+                state &= (1 << _PENDING_SHIFT) - 1
+                if source[position] in consonant_chars:
+                    state = state & ~_AFTER_SILENT | _AFTER_CONSONANT
+                elif state & _AFTER_CONSONANT:
+                    state |= _AFTER_SILENT
+                position += 1
+            return (position, state)
+        composites = self.plan.indic_to_bb_composite
+        def match_across_silent(reading, position):
+            # Numbers, ellipses and punctuation are only read once the
+            # silent characters are gone, so they can have some in between
+            # their characters; composites are matched before that
+            if not silent_chars or len(reading) < 2 or reading in composites:
+                return None
+            for char in reading:
+                while position < len(source) and \
+                      source[position] in silent_chars:
+                    position += 1
+                if source[position:position+1] != char:
+                    return None
+                position += 1
+            return position
+        (braille, moved) = self._undo_virama_reversal(braille)
+        length = len(braille)
+        # Reached (position in the source, state) pairs, by braille index;
+        # every step moves forward in the braille
+        pending = {0: {skip_silent(0, 0)}}
+        furthest = (0, 0)
+        (lengths, startswith) = (self._lengths, source.startswith)
+        for index in range(length):
+            reached = pending.pop(index, None)
+            if not reached:
+                continue
+            for (position, state) in reached:
+                if position > furthest[0]:
+                    furthest = (position, index)
+                for (size, reading, next_state) in lengths(braille, index,
+                                                           state):
+                    if startswith(reading, position):
+                        end = position + len(reading)
+                    else:
+                        end = match_across_silent(reading, position)
+                        if end is None:
+                            continue
+                    pending.setdefault(index + size, set()).add(
+                        skip_silent(end, next_state))
+        for (position, state) in pending.get(length, ()):
+            if position == len(source):
+                return None
+            if position > furthest[0]:
+                furthest = (position, length)
+        (position, index) = furthest
+        return Mismatch(self._text_offset(text, position),
+                        self._braille_offset(index, moved))
+
+    def _text_offset(self, text, position):
+        "Where position in the text as verify() read it is in text"
+        nukta_forms = self.plan.nukta_forms
+        index = 0
+        while index < len(text) and position > 0:
+            index += 2 if text[index:index+2] in nukta_forms else 1
+            position -= 1
+        return index
+
+_back_translators = {}
+
+def _back_translator(script):
+    "The BackTranslator for script; each is built once and kept"
+    if isinstance(script, str):
+        script = script_converters[script]
+    try:
+        return _back_translators[script]
+    except KeyError:
+        return _back_translators.setdefault(script, BackTranslator(script))
+
+def back_translate(braille, script):
+    """
+    Reads the braille back into the text of the script; returns the same as
+    BackTranslator.translate()
+    """
+    return _back_translator(script).translate(braille)
+
+def verify_round_trips(texts, script):
+    """
+    Converts each text to braille and reads it back; returns a list of
+    (index, Mismatch) for the texts that do not read back as themselves.
+    For checking conversions of a whole corpus: the texts are converted with
+    convert_many().
+    """
+    back_translator = _back_translator(script)
+    mismatches = []
+    results = convert_many(texts, back_translator.plan)
+    for (index, (text, (braille, _))) in enumerate(zip(texts, results)):
+        mismatch = back_translator.verify(text, braille)
+        if mismatch is not None:
+            mismatches.append((index, mismatch))
+    return mismatches
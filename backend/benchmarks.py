@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim: set sts=4 sw=4 et tw=0 :
+#
+# License:
+#  AGPL-3.0
+#  http://www.gnu.org/licenses/agpl-3.0.html
+#
+# Benchmarks for the Indic Unicode to Bharati Braille convertor
+#
+# Run from the top-level directory with: python3 -m backend.benchmarks
+#
+
+import marshal
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.converters import BrailleDocument, WordCache
+from backend.converters import convert_deduplicated, convert_many
+from backend.converters import dv_converter
+from backend.back_translation import verify_round_trips
+from backend.preprocessing import script_mappings
+from backend.preprocessing import _perform_mapping_pre_processing
+from backend.tests import DV_ACHARYA_INPUT, DV_SHIKSHAK_INPUT
+
+if sys.version_info.major != 3:
+    raise Exception("This program needs Python 3!")
+
+# Most that importing backend.converters may take, in ms
+IMPORT_TIME_BUDGET = 50
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import backend.converters
+imported = time.perf_counter()
+backend.converters.script_converters["dv"]
+print((imported - start) * 1000, (time.perf_counter() - imported) * 1000)
+"""
+
+def best_of(function, repeat=5):
+    "Returns the shortest time taken by function() in repeat runs, in ms"
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        taken = time.perf_counter() - start
+        if best is None or taken < best:
+            best = taken
+    return best * 1000
+
+def bench_import_time(repeat=5):
+    """
+    Imports backend.converters in a fresh interpreter and checks the time
+    against IMPORT_TIME_BUDGET, then times building the tables of a script
+    """
+    # The first run may have to write the bytecode
+    runs = [subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT])
+            for _ in range(repeat + 1)][1:]
+    (imported, built) = min(tuple(float(ms) for ms in run.split())
+                            for run in runs)
+    print("Import time")
+    print("  import:    {:8.1f} ms ({} budget of {} ms)".format(
+          imported, "within" if imported <= IMPORT_TIME_BUDGET else "OVER",
+          IMPORT_TIME_BUDGET))
+    print("  first dv:  {:8.1f} ms".format(built))
+    return imported <= IMPORT_TIME_BUDGET
+
+def bench_table_building():
+    """
+    Times the pre-processing of the mappings of every script against reading
+    the same tables back from an on-disk cache with marshal
+    """
+    def preprocess():
+        return dict((name, _perform_mapping_pre_processing(*mapping[2:]))
+                    for (name, mapping) in script_mappings.items())
+    tables = dict((name, tuple(dict(table) if hasattr(table, "keys")
+                               else table for table in script_tables))
+                  for (name, script_tables) in preprocess().items())
+    (handle, path) = tempfile.mkstemp()
+    try:
+        with os.fdopen(handle, "wb") as cache:
+            marshal.dump(tables, cache)
+        def load():
+            with open(path, "rb") as cache:
+                return marshal.load(cache)
+        print("Building the tables of all scripts")
+        print("  pre-processing: {:7.2f} ms".format(best_of(preprocess)))
+        print("  marshal.load(): {:7.2f} ms".format(best_of(load)))
+    finally:
+        os.remove(path)
+
+def bench_thread_scaling(thread_counts=(1, 2, 4, 8)):
+    """
+    Converts the same batch of texts with convert_many() using more and more
+    threads. Only a free-threaded (no GIL) build of Python can scale here.
+    """
+    texts = [DV_ACHARYA_INPUT, DV_SHIKSHAK_INPUT] * 5000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Thread scaling of convert_many() ({} texts, GIL {})".format(
+          len(texts), "enabled" if gil else "disabled"))
+    serial = best_of(lambda: convert_many(texts, "dv"))
+    print("  serial:    {:8.1f} ms".format(serial))
+    for count in thread_counts:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            taken = best_of(lambda: convert_many(texts, "dv",
+                                                 executor=executor))
+        print("  {} threads: {:8.1f} ms ({:.2f}x)".format(count, taken,
+                                                          serial / taken))
+
+def bench_word_cache():
+    "Converts the same text with and without a (warm) WordCache"
+    text = (DV_ACHARYA_INPUT + "\n" + DV_SHIKSHAK_INPUT + "\n") * 500
+    cache = WordCache()
+    cache.convert(text, dv_converter)
+    print("Word cache ({} characters)".format(len(text)))
+    print("  uncached:  {:8.1f} ms".format(
+          best_of(lambda: dv_converter.convert(text))))
+    print("  cached:    {:8.1f} ms".format(
+          best_of(lambda: cache.convert(text, dv_converter))))
+    print("  {}".format(cache.info()))
+    print("  deduplicated: {:5.1f} ms".format(
+          best_of(lambda: convert_deduplicated(text, dv_converter))))
+
+def bench_document_edit(pages=300):
+    """
+    Types a character into the middle of a long document, and adds and
+    removes a line there, against converting all of it again
+    """
+    page = (DV_ACHARYA_INPUT + "\n" + DV_SHIKSHAK_INPUT + "\n") * 4
+    text = page * pages
+    document = BrailleDocument(text, dv_converter)
+    middle = len(text) // 2
+    def edit():
+        document.apply_edit(middle, middle, "क")
+        document.apply_edit(middle, middle, "\n")
+        document.apply_edit(middle, middle + 2, "")
+    print("Editing a document of {} pages ({} characters)".format(
+          pages, len(text)))
+    print("  convert all:  {:8.2f} ms".format(
+          best_of(lambda: dv_converter.convert(text))))
+    print("  3 edits:      {:8.2f} ms".format(best_of(edit, repeat=50)))
+
+def bench_round_trips():
+    "Converts a batch of texts, against converting and reading them back"
+    texts = [DV_ACHARYA_INPUT, DV_SHIKSHAK_INPUT] * 500
+    print("Round trips ({} texts)".format(len(texts)))
+    print("  convert:      {:8.1f} ms".format(
+          best_of(lambda: convert_many(texts, "dv"))))
+    print("  round trips:  {:8.1f} ms".format(
+          best_of(lambda: verify_round_trips(texts, "dv"))))
+
+if __name__ == "__main__":
+    bench_import_time()
+    bench_table_building()
+    bench_thread_scaling()
+    bench_word_cache()
+    bench_document_edit()
+    bench_round_trips()
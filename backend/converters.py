@@ -13,12 +13,22 @@
 #
 # str.maketrans (faster than) str.replace (faster than) re.sub
 #
-# TODO: Compile the regular expressions used in this module to speed things up
-# TODO: Script detection is implemented very naïvely, and is slow as hell
+# Everything that only depends on the mappings (translate tables, composite
+# tables, compiled regular expressions) is built once at import time; see
+# ScriptConverter. None of it is changed after that: sets are frozensets and
+# mappings are read-only proxies, so it can all be shared between threads.
 #
 
 import re
 import sys
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_right
+from collections import namedtuple, OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
 
 if sys.version_info.major != 3:
     raise Exception("This program needs Python 3!")
@@ -29,6 +39,22 @@ from .mappings.common import numbers, number_prefix, math_punctuation
 # We warn when these are inputted
 from .mappings.common import dumb_quotes, math_symbols
 
+# Building the tables from the mappings; see preprocessing.py
+from .preprocessing import script_mappings, mappings_hash, _script_letters
+from .preprocessing import _perform_common_pre_processing
+from .preprocessing import _perform_mapping_pre_processing
+
+# The tables built from the mappings, written out by generate_tables.py. If
+# they are not there, or were generated from mappings other than these, they
+# are built from the mappings when needed.
+try:
+    from . import tables as generated_tables
+except ImportError:
+    generated_tables = None
+tables_up_to_date = (generated_tables is not None and
+                     getattr(generated_tables, "mappings_hash", None) ==
+                     mappings_hash())
+
 # Devanagari mappings
 from .mappings.dv import dv_virama, dv_schwa, dv_composite_letters, dv_akhand
 from .mappings.dv import dv_vowels, dv_consonants, dv_various_signs
@@ -45,13 +71,17 @@ from .mappings.te import te_vowels, te_consonants, te_various_signs
 from .mappings.ta import ta_virama, ta_schwa, ta_akhand
 from .mappings.ta import ta_vowels, ta_consonants, ta_various_signs
 
-BB_WARN_WRAPPER = """<p class="warning">{0}</p>\n"""
-BB_WARN_DUMB_QUOTES = BB_WARN_WRAPPER.format("""The convertor does not handle <a href="about.html#conv_limitations">dumb quotes</a>.""")
-BB_WARN_MATH_OPS = BB_WARN_WRAPPER.format("""The convertor does not handle <a href="about.html#conv_limitations">mathematical operators</a>.""")
-# XXX: Link to contribute page?
-BB_ERR_UNKNOWN_SCRIPT = BB_WARN_WRAPPER.format("""Unable to convert to Bharati Braille: Unknown script.""")
-# TODO: Link to Bharati Braille limitation concerning multi-script text
-BB_ERR_MANY_SCRIPTS = BB_WARN_WRAPPER.format("""Unable to convert to Bharati Braille: Multiple scripts in input.""")
+# Kinds of ConversionWarning. The messages shown for them are in
+# brailleconverter.py
+BB_WARN_DUMB_QUOTES = "dumb_quotes"
+BB_WARN_MATH_OPS = "math_ops"
+BB_ERR_UNKNOWN_SCRIPT = "unknown_script"
+BB_ERR_MANY_SCRIPTS = "many_scripts"
+
+# Something in the text that could not be converted properly: where it first
+# turns up in the braille output, and how many times. Errors about the text
+# as a whole (BB_ERR_*) have no offset.
+ConversionWarning = namedtuple("ConversionWarning", "kind offset count")
 
 def insert_explicit_schwa(text, schwa, all_consonants, vowel_chars, debug=False):
     "[consonant][vowel] -> [consonant][schwa][vowel]"
@@ -87,235 +117,1749 @@ def translate_math(text, debug=False):
      123, (not a number sequence)
      ,999 (prefix inserted after the comma)
     Which matches precisely what we need.
+
+    Each number is found and translated in one go by _translate_number();
+    text without numbers is returned as it is.
     """
-    #
-    ## Match something that:
-    ## * Is a number «[{0}]+»
-    ## * Number may start with a decimal point
-    ## * Number may contain commas and/or more decimal points.
-    pattern = r"(\.?[{0}]+[{0}\.,]*)".format(''.join(number_chars))
-    repl = r"{0}\1".format(number_prefix)
-    text = re.sub(pattern, repl, text, flags=re.MULTILINE)
-    # Translate commas for numbers such as: 1,500,000
-    pattern = r"([{0}]+?){1}(?=[{0}]+?)".format(''.join(number_chars), ",")
-    repl = r"\1{0}".format(cm_to_bb_math_punctuation[","])
-    text = re.sub(pattern, repl, text, flags=re.MULTILINE)
-    # Translate decimal points for numbers such as: .5
-    pattern = r"(?=[^{0}]+?)?{1}([{0}]+?)".format(''.join(number_chars), "\.")
-    repl = r"{0}\1".format(cm_to_bb_math_punctuation["."])
-    text = re.sub(pattern, repl, text, flags=re.MULTILINE)
-    # Translate decimal points for numbers such as: 0.5 and 1.0.5
-    pattern = r"([{0}]+?){1}(?=[{0}]+?)".format(''.join(number_chars), "\.")
-    repl = r"\1{0}".format(cm_to_bb_math_punctuation["."])
-    text = re.sub(pattern, repl, text, flags=re.MULTILINE)
-    # Translate numbers to braille characters without adding a number prefix
-    text = text.translate(str.maketrans(cm_to_bb_numbers))
+    # Searching for a digit is much faster than for a number
+    if digit_pattern.search(text):
+        text = number_pattern.sub(_number_repl, text)
     if debug:
         print("After math translation:\n"+text)
     return text
 
 def convert_common_glyphs_to_braille(text, debug=False):
-    new_text = text[:]
+    return _run_stages(common_glyph_stages, text, debug)
+
+def _replace_ellipses(text, debug=False):
     # Convert a fake ellipsis (...) as well
-    new_text = re.sub("(?=[^.]?)(\.\.\.)(?=[^.]?)", ellipsis, new_text)
-    new_text = translate_math(new_text, debug)
-    new_text = new_text.translate(str.maketrans(cm_to_bb_punctuation))
+    return ellipsis_pattern.sub(ellipsis, text)
+
+def _translate_punctuation(text, debug=False):
+    new_text = text.translate(cm_to_bb_punctuation_table)
     if debug:
         print("After common glyph translation:\n"+new_text)
     return new_text
 
+# The stages of convert_common_glyphs_to_braille(), with the names they are
+# recorded under in ConversionStats. The math stage runs in the middle of the
+# common glyphs stage, which is recorded as one.
+common_glyph_stages = (("common_glyphs", _replace_ellipses),
+                       ("math", translate_math),
+                       ("common_glyphs", _translate_punctuation))
+
+def _run_stages(stages, text, debug=False, stats=None):
+    """
+    Runs the text through stages, a sequence of (name, function) where each
+    function takes the text and debug and returns the new text. If stats is
+    given, each stage is recorded in it once all of its pieces have run,
+    with the time taken by all of them.
+    """
+    if stats is None:
+        for (_, function) in stages:
+            text = function(text, debug)
+        return text
+    clock = time.perf_counter
+    last = dict((name, index) for (index, (name, _)) in enumerate(stages))
+    # name -> [seconds, chars in, chars out]
+    timings = {}
+    for (index, (name, function)) in enumerate(stages):
+        start = clock()
+        new_text = function(text, debug)
+        seconds = clock() - start
+        timing = timings.setdefault(name, [0.0, len(text), 0])
+        timing[0] += seconds
+        timing[2] = len(new_text)
+        if last[name] == index:
+            stats.record(name, *timing)
+        text = new_text
+    return text
+
 def append_warnings(text):
-    # Warn about unhandled stuff
-    warnings = ""
-    text_set = set(text)
-    if text_set.intersection(set(dumb_quotes)):
-        warnings += BB_WARN_WRAPPER.format(BB_WARN_DUMB_QUOTES)
-    if text_set.intersection(all_math_symbols):
-        warnings += BB_WARN_WRAPPER.format(BB_WARN_MATH_OPS)
+    """
+    Warn about unhandled stuff; returns a list with a ConversionWarning for
+    each kind of character we warn about that is in the converted text
+    """
+    warnings = []
+    for (kind, chars) in warning_kinds:
+        (offset, count) = (None, 0)
+        for char in chars:
+            found = text.find(char)
+            if found != -1:
+                count += text.count(char, found)
+                if offset is None or found < offset:
+                    offset = found
+        if count:
+            warnings.append(ConversionWarning(kind, offset, count))
     return warnings
 
+
+class CompositeTrie(object):
+    """
+    Longest-match lookup of akhand ligatures and composite letters
+
+    Replacing each composite with str.replace() costs one pass over the text
+    per composite, and the result depends on the order in which overlapping
+    composites are replaced. The trie is walked once per position instead;
+    for bulk replacement it is also turned into a regular expression, with
+    longer continuations tried before shorter ones.
+    """
+
+    def __init__(self, composites):
+        root = {}
+        for (key, cells) in composites.items():
+            node = root
+            for char in key:
+                node = node.setdefault(char, {})
+            # None marks the end of a composite
+            node[None] = cells
+        self.root = self._freeze(root)
+        self.starters = frozenset(self.root)
+        self.max_length = max([len(key) for key in composites] or [0])
+        self.pattern = None
+        if self.root:
+            self.pattern = re.compile(self._regex(self.root))
+
+    @classmethod
+    def _freeze(cls, node):
+        return MappingProxyType(dict((char, cls._freeze(child)
+                                      if char is not None else child)
+                                     for (char, child) in node.items()))
+
+    @classmethod
+    def _regex(cls, node):
+        alternatives = [re.escape(char) + cls._regex(child) for (char, child)
+                        in sorted(node.items(), key=lambda item: item[0] or "")
+                        if char is not None]
+        if not alternatives:
+            return ""
+        if len(alternatives) == 1 and None not in node:
+            return alternatives[0]
+        regex = "(?:{0})".format("|".join(alternatives))
+        if None in node:
+            # Greedy, so the longer composite wins
+            regex += "?"
+        return regex
+
+    def match(self, text, index):
+        """
+        Returns (cells, end) for the longest composite starting at index, or
+        (None, index) if there is none
+        """
+        node = self.root
+        cells = None
+        end = index
+        length = len(text)
+        while index < length:
+            char = text[index]
+            if char not in node:
+                break
+            node = node[char]
+            index += 1
+            if None in node:
+                cells = node[None]
+                end = index
+        return (cells, end)
+
+    def matches(self, text, index):
+        """
+        Returns (cells, end) for each composite starting at index, the
+        shortest first; match() returns the last of them
+        """
+        node = self.root
+        found = []
+        length = len(text)
+        while index < length:
+            char = text[index]
+            if char not in node:
+                break
+            node = node[char]
+            index += 1
+            if None in node:
+                found.append((node[None], index))
+        return found
+
+    def replace(self, text):
+        "Replaces all composites in the text in a single scan"
+        if self.pattern is None:
+            return text
+        lookup = self.lookup
+        return self.pattern.sub(lambda match: lookup(match.group()), text)
+
+    def lookup(self, key):
+        node = self.root
+        for char in key:
+            node = node[char]
+        return node[None]
+
+
+class ScriptConverter(object):
+    """
+    Conversion plan for a single Indic script.
+
+    Holds everything convert_indic_to_braille() needs that depends only on the
+    mappings: the compiled explicit-schwa and virama-reversal regular
+    expressions, the translate table and the composite (akhand) table. Build
+    one per script and reuse it; converting text then only runs the passes.
+    """
+
+    def __init__(self, schwa, virama, all_consonants, vowel_chars,
+                 indic_to_bb, indic_to_bb_composite, name=None,
+                 letters=frozenset()):
+        self.name = name
+        # Consonants and vowels; used for script detection
+        self.letters = letters
+        self.schwa = schwa
+        self.virama = virama
+        self.all_consonants = all_consonants
+        self.vowel_chars = vowel_chars
+        self.indic_to_bb = indic_to_bb
+        self.indic_to_bb_composite = indic_to_bb_composite
+        # all_consonants also has the akhand and composite strings in it
+        self.consonant_chars = frozenset(''.join(all_consonants))
+        # [consonant][vowel] -> [consonant][schwa][vowel]
+        self.schwa_pattern = re.compile(r"([{0}])([{1}])".format(
+            re.escape(''.join(sorted(self.consonant_chars))),
+            re.escape(''.join(sorted(vowel_chars)))), flags=re.MULTILINE)
+        self.schwa_repl = r"\1{0}\2".format(schwa)
+        # [any][virama] -> [virama][any]
+        self.virama_pattern = re.compile(r"(.){0}".format(re.escape(virama)),
+                                         flags=re.MULTILINE)
+        self.virama_repl = r"{0}\1".format(virama)
+        self.translate_table = MappingProxyType(str.maketrans(
+                                                    dict(indic_to_bb)))
+        # Composite letters written as [consonant][nukta] -> the precomposed
+        # consonant, where that has the same cells. Most precomposed nukta
+        # letters are composition exclusions, so NFC would decompose them
+        # instead. Composed by canonicalise(), they need no composite.
+        nukta_forms = {}
+        for (char, cells) in indic_to_bb.items():
+            key = unicodedata.normalize("NFD", char)
+            if len(key) == 2 and indic_to_bb_composite.get(key) == cells:
+                nukta_forms[key] = char
+        # A composite that can match across the consonant and the nukta
+        # would no longer match once they are composed; keep those
+        # composite letters, and the ones they clash with, in the trie
+        while True:
+            others = [key for key in indic_to_bb_composite
+                      if key not in nukta_forms]
+            kept = dict((key, char) for (key, char) in nukta_forms.items()
+                        if not any(other.endswith(key[0]) or key in other
+                                   for other in others))
+            if len(kept) == len(nukta_forms):
+                break
+            nukta_forms = kept
+        self.nukta_forms = MappingProxyType(nukta_forms)
+        self.nuktas = frozenset(key[1] for key in nukta_forms)
+        self.nukta_pattern = re.compile("|".join(
+            re.escape(key) for key in sorted(nukta_forms)))
+        self.composites = CompositeTrie(dict(
+            (key, cells) for (key, cells) in indic_to_bb_composite.items()
+            if key not in nukta_forms))
+        # For the inner loop of BrailleTransducer: (cells, class) for each
+        # character that is translated or has a class, so that one lookup
+        # does the work of several set lookups. Cells are None if the
+        # character is not translated. A private dict, since the method call
+        # of MappingProxyType.get() is measurable; never changed.
+        self._entries = {}
+        for char in (set(indic_to_bb) | self.consonant_chars |
+                     vowel_chars | self.composites.starters):
+            char_class = 0
+            if char in self.consonant_chars:
+                char_class |= CLASS_CONSONANT
+            if char in vowel_chars:
+                char_class |= CLASS_VOWEL_CHAR
+            if char in self.composites.starters:
+                char_class |= CLASS_COMPOSITE_START
+            self._entries[char] = (indic_to_bb.get(char), char_class)
+        # Used by BrailleTransducer
+        self.virama_starters = frozenset([virama] +
+            [char for (char, cells) in indic_to_bb.items()
+             if cells.startswith(virama)])
+        self.silent_chars = frozenset(char for (char, cells) in
+                                      indic_to_bb.items() if not cells)
+        # A word, and the whitespace before it if virama-reversal will move
+        # the virama in front of that; used by WordCache. An empty character
+        # class would not parse as one, so it is left out if no character
+        # is silent.
+        silent = ""
+        if self.silent_chars:
+            silent = "[{0}]*".format(
+                re.escape(''.join(sorted(self.silent_chars))))
+        self.word_pattern = re.compile(r"((?:[^\S\n](?={0}[{1}]))?\S+)".format(
+            silent, re.escape(''.join(sorted(self.virama_starters)))))
+        # The passes of convert(), in order, named as in ConversionStats
+        self.stages = (("nukta", self.canonicalise),
+                       ("schwa", self.insert_explicit_schwa),
+                       ("composites", self.replace_composites),
+                       ("charset", self.translate_charset),
+                       ("virama", self.virama_reversal)) + common_glyph_stages
+
+    def __reduce__(self):
+        """
+        Pickles the arguments the plan was built from, with the tables as
+        plain dicts, since MappingProxyType cannot be pickled; the plan is
+        built again when unpickled. Used to send plans that are not in
+        script_converters to worker processes.
+        """
+        return (type(self), (self.schwa, self.virama, self.all_consonants,
+                             self.vowel_chars, dict(self.indic_to_bb),
+                             dict(self.indic_to_bb_composite), self.name,
+                             self.letters))
+
+    def canonicalise(self, text, debug=False):
+        """
+        [consonant][nukta] -> precomposed consonant; see nukta_forms. Text
+        without a nukta in it, which is nearly all of it, is returned as is.
+        """
+        new_text = text
+        for nukta in self.nuktas:
+            if nukta in text:
+                new_text = self.nukta_pattern.sub(self._compose_nukta, text)
+                break
+        if debug:
+            print("After nukta canonicalisation:\n"+new_text)
+        return new_text
+
+    def _compose_nukta(self, match):
+        return self.nukta_forms[match.group()]
+
+    def insert_explicit_schwa(self, text, debug=False):
+        "[consonant][vowel] -> [consonant][schwa][vowel]"
+        new_text = self.schwa_pattern.sub(self.schwa_repl, text)
+        if debug:
+            print("After explicit-schwa conversion:\n"+new_text)
+        return new_text
+
+    def replace_composites(self, text, debug=False):
+        "Replace akhand characters and composite letters"
+        text = self.composites.replace(text)
+        if debug:
+            print("After string-to-char conversion:\n"+text)
+        return text
+
+    def translate_charset(self, text, debug=False):
+        "Substitute vowels and consonants"
+        new_text = text.translate(self.translate_table)
+        if debug:
+            print("After charset translation:\n"+new_text)
+        return new_text
+
+    def virama_reversal(self, text, debug=False):
+        "Do the virama-reversal using the compiled regular expression"
+        new_text = self.virama_pattern.sub(self.virama_repl, text)
+        if debug:
+            print("After viraama-reversal:\n"+new_text)
+        return new_text
+
+    def convert(self, text, debug=False, stats=None, offsets=False):
+        """
+        Converts the given text to Bharati Braille; see
+        convert_indic_to_braille() for the order of conversion
+
+        If stats is given, the time taken by each stage is recorded in it; see
+        ConversionStats.
+
+        If offsets, also returns where the cells of each character of the
+        text start in the braille; see BrailleTransducer.convert(). The
+        passes cannot keep track of that, so this is done by transduce(),
+        and stats cannot be given as well.
+        """
+        if offsets:
+            if stats is not None:
+                raise TypeError("stats cannot be recorded with offsets")
+            return self.transduce(text, offsets)
+        new_text = _run_stages(self.stages, text, debug, stats)
+        if stats is None:
+            return (new_text, append_warnings(new_text))
+        start = time.perf_counter()
+        warnings = append_warnings(new_text)
+        stats.record("warnings", time.perf_counter() - start, len(new_text),
+                     len(warnings))
+        return (new_text, warnings)
+
+    def transduce(self, text, offsets=False):
+        "Same as convert(), but done in a single pass by BrailleTransducer"
+        return BrailleTransducer(self).convert(text, offsets)
+
+
+# Totals for one stage of conversion; see ConversionStats
+StageStats = namedtuple("StageStats", "calls seconds chars_in chars_out")
+
+class ConversionStats(object):
+    """
+    Collects the time taken by each stage of conversion, for finding out
+    where the time goes on real input
+
+    Pass one as stats to ScriptConverter.convert(),
+    convert_any_indic_to_braille() or convert_mixed_indic_to_braille(). Any
+    object with a record() method like this one's can be passed instead.
+
+    The stages are: detect (script detection), nukta, schwa, composites,
+    charset, virama, math, common_glyphs (ellipses and punctuation) and
+    warnings.
+    """
+
+    def __init__(self):
+        # stage -> StageStats
+        self.stages = OrderedDict()
+
+    def record(self, stage, seconds, chars_in, chars_out):
+        "Adds one run of a stage that took seconds"
+        (calls, total, total_in, total_out) = self.stages.get(stage,
+                                                              (0, 0.0, 0, 0))
+        self.stages[stage] = StageStats(calls + 1, total + seconds,
+                                        total_in + chars_in,
+                                        total_out + chars_out)
+
+    def total(self):
+        "Returns the time taken by all the stages, in seconds"
+        return sum(stage.seconds for stage in self.stages.values())
+
+    def report(self):
+        "Returns a table of the stats for printing"
+        lines = ["{:<14}{:>8}{:>12}{:>8}{:>12}{:>12}".format(
+                 "stage", "calls", "ms", "%", "chars in", "chars out")]
+        total = self.total() or 1
+        for (stage, stats) in self.stages.items():
+            lines.append("{:<14}{:>8}{:>12.3f}{:>8.1f}{:>12}{:>12}".format(
+                         stage, stats.calls, stats.seconds * 1000,
+                         stats.seconds * 100 / total, stats.chars_in,
+                         stats.chars_out))
+        return "\n".join(lines)
+
+
+# Character classes, as bits; see char_classes. The first three are also
+# used in ScriptConverter._entries.
+# Part of a consonant, as far as the explicit schwa goes
+CLASS_CONSONANT = 0x001
+# Vowel letter; not a vowel sign
+CLASS_VOWEL_CHAR = 0x002
+# First character of an akhand character or composite letter
+CLASS_COMPOSITE_START = 0x004
+# Vowel sign (maatra)
+CLASS_VOWEL_SIGN = 0x008
+# Virama, or anything else that starts with the virama cell in braille
+CLASS_VIRAMA = 0x010
+CLASS_DIGIT = 0x020
+# Decimal point or comma, inside a number
+CLASS_NUMBER_PUNCTUATION = 0x040
+CLASS_PUNCTUATION = 0x080
+CLASS_DUMB_QUOTE = 0x100
+CLASS_MATH_SYMBOL = 0x200
+
+def char_class_of(char):
+    "Returns the CLASS_* bits of the character; 0 if it has none"
+    code = ord(char)
+    if code < len(char_classes):
+        return char_classes[code]
+    return 0
+
+def _translate_number(token):
+    """
+    Translates a single number as matched by number_pattern, number prefix
+    included. Commas between two digits and decimal points followed by a
+    digit get their math_punctuation cells; other commas and full stops are
+    left alone (for translating as punctuation).
+    """
+    if "," not in token and "." not in token:
+        return number_prefix + token.translate(cm_to_bb_numbers_table)
+    cells = [number_prefix]
+    last = len(token) - 1
+    for (index, char) in enumerate(token):
+        if char == ",":
+            if 0 < index < last and token[index-1] in number_chars \
+                                and token[index+1] in number_chars:
+                char = cm_to_bb_math_punctuation[","]
+        elif char == ".":
+            if index < last and token[index+1] in number_chars:
+                char = cm_to_bb_math_punctuation["."]
+        else:
+            char = cm_to_bb_numbers[char]
+        cells.append(char)
+    return ''.join(cells)
+
+def _number_repl(match):
+    "Used by translate_math()"
+    return _translate_number(match.group())
+
+
+class ScriptConflict(Exception):
+    "A letter from another script turned up while converting"
+
+
+class BrailleTransducer(object):
+    """
+    Single-pass alternative to ScriptConverter.convert()
+
+    Walks the text once, left to right, doing the work of all the passes of
+    convert_indic_to_braille() as it goes:
+    0. Nukta forms are composed first; see ScriptConverter.canonicalise()
+    1. Explicit schwa is decided by looking at the previous source character
+    2. Akhand characters and composite letters are matched longest-first
+    3. Vowels and consonants are looked up in the same table
+    4. Virama-reversal is decided by looking at the next source character
+    5. Fake ellipses, numbers and punctuation go through a small state
+       machine fed with the cells that come out of the steps above
+    6. Characters we warn about are noted as they go past
+
+    The output is the same as that of ScriptConverter.convert().
+
+    If foreign_letters is given, ScriptConflict is raised as soon as one of
+    them is seen; see convert_any_indic_to_braille().
+    """
+
+    def __init__(self, plan, foreign_letters=frozenset()):
+        self.plan = plan
+        self.foreign_letters = foreign_letters
+        self.reset()
+
+    def reset(self):
+        # Previous source character; for the explicit schwa
+        self._prev = ""
+        # The virama starting the next (non-silent) token has already been
+        # moved before the previous cell
+        self._virama_taken = False
+        # Source text that could not be decided on yet; see feed()
+        self._carry = ""
+        # Full stops seen in a row, as the tickets of each (see _marks);
+        # three make an ellipsis
+        self._dots = []
+        # A full stop that starts a number if a digit follows it, and its
+        # tickets
+        self._lone_dot = False
+        self._lone_dot_tickets = ()
+        # Characters of the number being read, if any
+        self._number = None
+        # kind -> [offset, count] of what we warn about. Until the output
+        # before it is taken, offset is the index in _out instead.
+        self._warnings = {}
+        self._pending_offsets = False
+        # Length of the output taken so far
+        self._taken = 0
+        self._out = []
+        # If offsets are wanted, the index in _out of the piece each source
+        # character starts in. Characters fed to the common glyph state
+        # machine while it is holding cells back are not placed yet: their
+        # (start, end) tickets go with the next cell fed to it, and are
+        # placed when that cell is.
+        self._marks = None
+        self._tickets = []
+
+    def convert(self, text, offsets=False):
+        """
+        Converts the whole text; returns (braille, warnings)
+
+        If offsets, returns (braille, warnings, offsets) instead, where
+        offsets is an array('I') with the index in braille at which the
+        cells of each character of the text start, and len(braille) at the
+        end. A character that has no cells of its own (a silent character,
+        or a virama moved before the previous cell) gets the index of the
+        cells that come after it, and each character of an akhand or of a
+        number gets the index of the whole.
+        """
+        self.reset()
+        canonical = self.plan.canonicalise(text)
+        if not offsets:
+            self._run(canonical, True)
+            return self.finish()
+        self._marks = [0] * len(canonical)
+        self._run(canonical, True)
+        self._flush_dots()
+        self._end_number()
+        self._place(self._tickets)
+        offsets = self._offsets(text, canonical)
+        return self.finish() + (offsets,)
+
+    def feed(self, text):
+        """
+        Converts the next piece of a text; returns as much braille as can be
+        decided on. The rest is held back until the next call to feed() or
+        finish(), so the text can be split anywhere.
+        """
+        # The last character is always carried over, so a consonant and its
+        # nukta are composed even when they come in different pieces
+        text = self.plan.canonicalise(self._carry + text)
+        self._carry = text[self._run(text, False):]
+        return self._take_output()
+
+    def finish(self):
+        "Flushes pending state; returns (braille, warnings)"
+        if self._carry:
+            self._run(self._carry, True)
+        self._flush_dots()
+        self._end_number()
+        text = self._take_output()
+        warnings = [ConversionWarning(kind, *self._warnings[kind])
+                    for (kind, _) in warning_kinds if kind in self._warnings]
+        self.reset()
+        return (text, warnings)
+
+    def _offsets(self, text, canonical):
+        "Resolves _marks, before the output is taken; see convert()"
+        starts = [self._taken]
+        for cells in self._out:
+            starts.append(starts[-1] + len(cells))
+        marks = [starts[piece] for piece in self._marks]
+        if canonical is not text:
+            # A consonant and its nukta both start where the precomposed
+            # consonant does
+            source = []
+            (last, composed) = (0, 0)
+            for match in self.plan.nukta_pattern.finditer(text):
+                (start, end) = match.span()
+                source.extend(marks[composed:composed + start - last])
+                composed += start - last
+                source.extend([marks[composed]] * (end - start))
+                composed += 1
+                last = end
+            source.extend(marks[composed:])
+            marks = source
+        marks.append(starts[-1])
+        return array("I", marks)
+
+    def _take_output(self):
+        out = self._out
+        if self._pending_offsets:
+            self._pending_offsets = False
+            for warning in self._warnings.values():
+                if warning[0] < 0:
+                    # Index in _out, stored as -1 - index
+                    warning[0] = self._taken + sum(
+                        [len(cells) for cells in out[:-1 - warning[0]]])
+        text = ''.join(out)
+        del out[:]
+        self._taken += len(text)
+        return text
+
+    def _run(self, text, final):
+        """
+        Converts text up to the first token that cannot be decided on without
+        looking at text that comes after it; returns where that token starts.
+        If final, there is no more text and all of it is converted.
+        """
+        plan = self.plan
+        entries = plan._entries
+        no_entry = (None, 0)
+        match_composite = plan.composites.match
+        max_length = plan.composites.max_length
+        consonants = plan.consonant_chars
+        virama_starters = plan.virama_starters
+        silent_chars = plan.silent_chars
+        lookahead_chars = virama_starters | silent_chars
+        foreign_letters = self.foreign_letters
+        marks = self._marks
+        schwa = plan.schwa
+        virama = plan.virama
+        virama_length = len(virama)
+        append = self._out.append
+        feed = self._feed_common
+        # Whether the previous source character is a consonant
+        after_consonant = self._prev in consonants
+        taken = self._virama_taken
+        busy = self._busy()
+        length = len(text)
+        # Tokens before guard can be decided on without looking past the end
+        # of the text: there is room for the longest composite after them,
+        # and a non-silent character to look at for the virama-reversal.
+        guard = length
+        if not final:
+            tail = length
+            while tail > 0 and text[tail-1] in silent_chars:
+                tail -= 1
+            guard = tail - max(max_length, 1)
+        index = 0
+        while index < length:
+            if index >= guard and not self._decidable(text, index):
+                break
+            char = text[index]
+            (cells, char_class) = entries.get(char, no_entry)
+            end = index + 1
+            if char_class & CLASS_COMPOSITE_START:
+                (composite, composite_end) = match_composite(text, index)
+                if composite is not None:
+                    (cells, end) = (composite, composite_end)
+            translated = cells is not None
+            if not translated:
+                if char in foreign_letters:
+                    raise ScriptConflict(char)
+                cells = char
+            elif char_class & CLASS_VOWEL_CHAR and after_consonant:
+                cells = schwa + cells
+            if end == index + 1:
+                after_consonant = char_class & CLASS_CONSONANT
+            else:
+                after_consonant = text[end-1] in consonants
+            if marks is not None:
+                # Unless the common glyph state machine is holding cells
+                # back, the cells of this token go in the next piece
+                if busy or end > index + 1:
+                    self._mark(index, end, busy)
+                else:
+                    marks[index] = len(self._out)
+            index = end
+            if not cells:
+                continue
+            if taken:
+                # Our virama went before the previous cell already
+                cells = cells[virama_length:]
+                taken = False
+                if not cells:
+                    continue
+            elif end < length and text[end] in lookahead_chars \
+                               and cells[-1] != "\n":
+                # Virama-reversal: [cell][virama] -> [virama][cell]
+                ahead = end
+                while ahead < length and text[ahead] in silent_chars:
+                    ahead += 1
+                if ahead < length and text[ahead] in virama_starters:
+                    cells = cells[:-1] + virama + cells[-1]
+                    taken = True
+            if not busy and (translated or char not in common_glyph_chars):
+                append(cells)
+            else:
+                busy = feed(cells)
+        if index:
+            self._prev = text[index-1]
+        self._virama_taken = taken
+        return index
+
+    def _decidable(self, text, index):
+        """
+        Whether the token at index can be converted without looking at text
+        that comes after this
+        """
+        composites = self.plan.composites
+        end = index + 1
+        if text[index] in composites.starters:
+            if index + composites.max_length > len(text):
+                return False
+            end = max(composites.match(text, index)[1], end)
+        while end < len(text) and text[end] in self.plan.silent_chars:
+            end += 1
+        return end < len(text)
+
+    def _mark(self, start, end, busy):
+        """
+        Notes where the cells of text[start:end] start: in the next piece
+        of output, or with the next cell fed to the common glyph state
+        machine if that is busy
+        """
+        if busy:
+            self._tickets.append((start, end))
+        else:
+            self._place([(start, end)])
+
+    def _place(self, tickets):
+        "Marks the characters of the tickets as starting in the next piece"
+        piece = len(self._out)
+        for (start, end) in tickets:
+            for index in range(start, end):
+                self._marks[index] = piece
+
+    def _busy(self):
+        return bool(self._dots or self._lone_dot or self._number is not None)
+
+    def _feed_common(self, cells):
+        """
+        Feeds cells that have been through virama-reversal to the
+        common glyph state machine; returns True if it is holding any back
+        """
+        tickets = self._tickets
+        if tickets:
+            self._tickets = []
+        for char in cells:
+            if char == ".":
+                self._dots.append(tickets)
+                if len(self._dots) == 3:
+                    dots = self._dots
+                    self._dots = []
+                    self._common_glyph(ellipsis, [ticket for dot in dots
+                                                  for ticket in dot])
+            else:
+                self._flush_dots()
+                self._common_glyph(char, tickets)
+            tickets = ()
+        return self._busy()
+
+    def _flush_dots(self):
+        dots = self._dots
+        self._dots = []
+        for tickets in dots:
+            self._common_glyph(".", tickets)
+
+    def _common_glyph(self, char, tickets=()):
+        try:
+            glyph_class = char_classes[ord(char)]
+        except (IndexError, TypeError):
+            # Past the table, or the ellipsis (several cells): no class
+            glyph_class = 0
+        # A number goes out as the next piece once it ends
+        if self._number is not None:
+            if glyph_class & (CLASS_DIGIT | CLASS_NUMBER_PUNCTUATION):
+                if tickets:
+                    self._place(tickets)
+                self._number.append(char)
+                return
+            self._end_number()
+        elif self._lone_dot:
+            self._lone_dot = False
+            if glyph_class & CLASS_DIGIT:
+                if self._lone_dot_tickets or tickets:
+                    self._place(self._lone_dot_tickets)
+                    self._place(tickets)
+                self._number = [".", char]
+                return
+            if self._lone_dot_tickets:
+                self._place(self._lone_dot_tickets)
+            self._out.append(".")
+        if char == ".":
+            self._lone_dot = True
+            self._lone_dot_tickets = tickets
+            return
+        if tickets:
+            self._place(tickets)
+        if glyph_class & CLASS_DIGIT:
+            self._number = [char]
+        else:
+            if glyph_class & (CLASS_DUMB_QUOTE | CLASS_MATH_SYMBOL):
+                self._warn(char)
+            self._out.append(cm_to_bb_punctuation.get(char, char))
+
+    def _warn(self, char):
+        "Notes a character we warn about, which goes out next"
+        kind = warning_char_kinds[char]
+        if kind in self._warnings:
+            self._warnings[kind][1] += 1
+        else:
+            self._warnings[kind] = [-1 - len(self._out), 1]
+            self._pending_offsets = True
+
+    def _end_number(self):
+        if self._lone_dot:
+            self._lone_dot = False
+            if self._lone_dot_tickets:
+                self._place(self._lone_dot_tickets)
+            self._out.append(".")
+        if self._number is not None:
+            number = _translate_number(''.join(self._number))
+            self._number = None
+            self._out.append(number.translate(cm_to_bb_punctuation_table))
+
+
+def _merge_warnings(results):
+    """
+    Merges the (braille, warnings) of pieces of a text converted separately
+    into the warnings append_warnings() would have given for the whole text
+    """
+    # kind -> [offset, count]
+    merged = {}
+    offset = 0
+    for (braille, warnings) in results:
+        for warning in warnings:
+            if warning.kind in merged:
+                merged[warning.kind][1] += warning.count
+            else:
+                merged[warning.kind] = [offset + warning.offset,
+                                        warning.count]
+        offset += len(braille)
+    return [ConversionWarning(kind, *merged[kind])
+            for (kind, _) in warning_kinds if kind in merged]
+
+def _join_results(results):
+    "Joins the (braille, warnings) of pieces of a text converted separately"
+    return (''.join([braille for (braille, _) in results]),
+            _merge_warnings(results))
+
 def convert_indic_to_braille(text, schwa, virama, all_consonants,
                              vowel_chars, indic_to_bb, indic_to_bb_composite,
-                             debug=False):
+                             debug=False, offsets=False):
     """
     Converts the given text from the given Indic language to Bharati Braille
     Leaves unknown characters untouched
     
     The order of conversion *has* to be:
+    0. Compose nukta forms
     1. Insert explicit schwa
     2. Replace akhand characters
     3. Substitude vowels and consonants
     4. Replace numbers, punctuation, etc.
     5. Append warnings
+
+    If offsets, returns (braille, warnings, offsets), where offsets is an
+    array('I') of where the cells of each character of the text start in
+    the braille; see BrailleTransducer.convert().
+
+    The tables of a script in script_converters, such as dv_to_bb, are
+    converted with its ScriptConverter. For other tables a ScriptConverter
+    is built the first time tables with those contents are passed, and a
+    few of them are kept for when the same contents are passed again.
     """
-    new_text = text[:]
-    new_text = insert_explicit_schwa(new_text, schwa, all_consonants,
-                                     vowel_chars, debug)
-    # Do str.replace instead of str.maketrans for the string-to-char conversion
-    for (key, value) in indic_to_bb_composite.items():
-        new_text = new_text.replace(key, value)
-    if debug:
-        print("After string-to-char conversion:\n"+new_text)
-    new_text = new_text.translate(str.maketrans(indic_to_bb))
-    if debug:
-        print("After charset translation:\n"+new_text)
-    new_text = virama_reversal(new_text, virama)
-    new_text = convert_common_glyphs_to_braille (new_text, debug)
-    warnings = append_warnings(new_text)
-    return (new_text, warnings)
+    converter = _plan_for(schwa, virama, all_consonants, vowel_chars,
+                          indic_to_bb, indic_to_bb_composite)
+    return converter.convert(text, debug, offsets=offsets)
+
+# ScriptConverters built by convert_indic_to_braille(), by the contents of
+# the tables they were built from; the most recently built last
+_custom_plans = OrderedDict()
+
+def _plan_for(*arguments):
+    "The ScriptConverter for the arguments of convert_indic_to_braille()"
+    (schwa, virama, all_consonants, vowel_chars, indic_to_bb,
+     indic_to_bb_composite) = arguments
+    # The tables of a built-in plan are frozen, so they are matched by
+    # identity; the plan was built from them as they still are
+    for plan in list(script_converters.built.values()):
+        if plan.indic_to_bb is indic_to_bb and \
+           plan.indic_to_bb_composite is indic_to_bb_composite and \
+           plan.all_consonants is all_consonants and \
+           plan.vowel_chars is vowel_chars and \
+           plan.schwa == schwa and plan.virama == virama:
+            return plan
+    key = (schwa, virama, frozenset(all_consonants), frozenset(vowel_chars),
+           frozenset(indic_to_bb.items()),
+           frozenset(indic_to_bb_composite.items()))
+    try:
+        plan = _custom_plans[key]
+    except KeyError:
+        # Built from copies, so that later changes to the caller's tables
+        # do not change the plan
+        plan = ScriptConverter(schwa, virama, key[2], key[3],
+                               dict(indic_to_bb), dict(indic_to_bb_composite))
+        _custom_plans[key] = plan
+        while len(_custom_plans) > 8:
+            _custom_plans.popitem(last=False)
+    return plan
 
 def convert_devanagari_to_braille(text, debug=False):
-    return convert_indic_to_braille(text, dv_schwa, dv_virama,
-                                    all_dv_consonants, dv_vowel_chars,
-                                    dv_to_bb, dv_to_bb_composite, debug)
+    return script_converters["dv"].convert(text, debug)
 
 def convert_gujarati_to_braille(text, debug=False):
-    return convert_indic_to_braille(text, gu_schwa, gu_virama,
-                                    all_gu_consonants, gu_vowel_chars,
-                                    gu_to_bb, gu_to_bb_composite, debug)
+    return script_converters["gu"].convert(text, debug)
 
 def convert_bengali_to_braille(text, debug=False):
-    return convert_indic_to_braille(text, bn_schwa, bn_virama,
-                                    all_bn_consonants, bn_vowel_chars,
-                                    bn_to_bb, bn_to_bb_composite, debug)
+    return script_converters["bn"].convert(text, debug)
 
 def convert_telugu_to_braille(text, debug=False):
-    return convert_indic_to_braille(text, te_schwa, te_virama,
-                                    all_te_consonants, te_vowel_chars,
-                                    te_to_bb, te_to_bb_composite, debug)
+    return script_converters["te"].convert(text, debug)
 
 def convert_tamil_to_braille(text, debug=False):
-    return convert_indic_to_braille(text, ta_schwa, ta_virama,
-                                    all_ta_consonants, ta_vowel_chars,
-                                    ta_to_bb, ta_to_bb_composite, debug)
+    return script_converters["ta"].convert(text, debug)
 
 def _no_braille_converter_found(text, debug=False):
     if debug:
         print("No braille converter found for: {0}".format(text))
-    return ("", BB_ERR_UNKNOWN_SCRIPT)
+    return ("", [ConversionWarning(BB_ERR_UNKNOWN_SCRIPT, None, 1)])
 
 def _multiple_braille_converters_found(text, debug=False):
     if debug:
         print("Multiple converters found for: {0}".format(text))
-    return ("", BB_ERR_MANY_SCRIPTS)
+    return ("", [ConversionWarning(BB_ERR_MANY_SCRIPTS, None, 1)])
+
+def _resolve_plan(text, script):
+    """
+    Returns (plan, None) with the ScriptConverter for script, a name or a
+    plan; if script is None, the plan is that of the one script in the text.
+    Returns (None, result) if the text has no Indic script or more than one,
+    where result is what to give back for it.
+    """
+    if script is None:
+        runs = script_detector.detect(text, limit=2)
+        if not runs:
+            return (None, _no_braille_converter_found(text))
+        if len(runs) > 1:
+            return (None, _multiple_braille_converters_found(text))
+        return (runs[0].script, None)
+    if isinstance(script, str):
+        script = script_converters[script]
+    return (script, None)
+
+def _detect_scripts(text, limit, stats):
+    "Runs script_detector.detect(), recording it in stats if given"
+    if stats is None:
+        return script_detector.detect(text, limit)
+    start = time.perf_counter()
+    runs = script_detector.detect(text, limit)
+    # Detection gives back no text
+    stats.record("detect", time.perf_counter() - start, len(text), 0)
+    return runs
 
-def convert_any_indic_to_braille(text, debug=False):
+def convert_any_indic_to_braille(text, debug=False, stats=None):
     """
     Detects the indic script in use and uses the mapping matching that.
 
     If more than one indic script is detected in the text, throws an error and
     returns no output
+
+    The whole text is looked at before anything is converted; iter_convert()
+    instead starts converting with the script of the first Indic letter.
+
+    If stats is given, the time taken by each stage is recorded in it; see
+    ConversionStats.
+    """
+    runs = _detect_scripts(text, 2, stats)
+    if not runs:
+        return _no_braille_converter_found(text, debug)
+    if len(runs) > 1:
+        return _multiple_braille_converters_found(text, debug)
+    return runs[0].script.convert(text, debug, stats)
+
+
+def convert_mixed_indic_to_braille(text, debug=False, stats=None):
+    """
+    Like convert_any_indic_to_braille(), but text in more than one Indic script
+    is converted too: each run of text in a single script is converted with
+    the mapping for that script. See ScriptRun for which run the characters
+    that are common to all scripts end up in.
+    """
+    runs = _detect_scripts(text, None, stats)
+    if not runs:
+        return _no_braille_converter_found(text, debug)
+    if len(runs) == 1:
+        return runs[0].script.convert(text, debug, stats)
+    results = [run.script.convert(text[run.start:run.end], debug, stats)
+               for run in runs]
+    return _join_results(results)
+
+
+def split_text(text, size):
+    """
+    Splits the text into pieces of at least size characters (except the last)
+    that can be converted separately and joined back together. Pieces end
+    right before a newline where there is one within another size
+    characters, or else right before the next other whitespace; no
+    conversion rule looks past either of those.
+    """
+    pieces = []
+    start = 0
+    while len(text) - start > size:
+        end = text.find("\n", start + size, start + 2 * size)
+        if end == -1:
+            match = whitespace_pattern.search(text, start + size)
+            if not match:
+                break
+            end = match.start()
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return pieces
+
+def _convert_shard(script, text):
+    "Used by convert_parallel() and aconvert(); runs in the worker processes"
+    if isinstance(script, str):
+        script = script_converters[script]
+    return script.convert(text)
+
+def _plan_key(plan):
+    """
+    What to send to the worker processes for the plan: its name if it is the
+    plan in script_converters, so that the workers use their own copy
+    """
+    if script_converters.get(plan.name) is plan:
+        return plan.name
+    return plan
+
+def convert_parallel(text, script=None, workers=None, shard_size=262144,
+                     executor=None):
+    """
+    Converts a large text using a pool of processes; returns the same as
+    convert_any_indic_to_braille() (or ScriptConverter.convert() if a script
+    is given)
+
+    The text is split into shards of about shard_size characters with
+    split_text(), and the shards are converted in parallel by a
+    ProcessPoolExecutor with the given number of workers. Pass an executor to
+    reuse its worker processes, which then only load the mappings once.
+    """
+    (script, error) = _resolve_plan(text, script)
+    if error is not None:
+        return error
+    shards = split_text(text, shard_size)
+    if len(shards) == 1:
+        return script.convert(text)
+    name = _plan_key(script)
+    if executor is None:
+        # Not imported at the top, since it pulls in multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_convert_shard, [name] * len(shards),
+                                    shards))
+    else:
+        results = list(executor.map(_convert_shard, [name] * len(shards),
+                                    shards))
+    return _join_results(results)
+
+async def aconvert(text, script=None, executor=None, chunk_size=65536):
+    """
+    Converts text without blocking the asyncio event loop; returns the same
+    as convert_any_indic_to_braille() (or ScriptConverter.convert() if a
+    script is given)
+
+    The text is split into chunks of about chunk_size characters with
+    split_text(), and the chunks are converted one after the other in the
+    executor (the loop's default executor if None; a ProcessPoolExecutor
+    works too). The loop runs other tasks in the meantime, and cancelling
+    the task stops the conversion before the next chunk; only the chunk
+    being converted at the time runs to the end.
+
+    Script detection still runs in the loop's thread, but it is a single
+    search through the text.
+    """
+    # Not imported at the top, since only the asyncio service needs it
+    import asyncio
+    (script, error) = _resolve_plan(text, script)
+    if error is not None:
+        return error
+    name = _plan_key(script)
+    loop = asyncio.get_running_loop()
+    results = []
+    for chunk in split_text(text, chunk_size):
+        results.append(await loop.run_in_executor(executor, _convert_shard,
+                                                  name, chunk))
+    if len(results) == 1:
+        return results[0]
+    return _join_results(results)
+
+def convert_many(texts, script=None, group_size=4096, threads=None,
+                 executor=None):
+    """
+    Converts a number of separate texts; returns a list with a
+    (braille, warnings) tuple for each, in order
+
+    script is the name of a script in script_converters, or a ScriptConverter.
+    If it is None, the script of each text is detected like
+    convert_any_indic_to_braille() does.
+
+    Texts in the same script that are shorter than group_size are joined with
+    newlines and converted together, since no conversion rule crosses a
+    newline; the braille is then split up again. Set group_size to 0 to
+    convert each text on its own.
+
+    If threads is given, the groups are converted by a ThreadPoolExecutor with
+    that many threads (or by the given executor). The conversion tables are
+    never changed after import, so the threads need no locking; this only
+    speeds things up on a free-threaded (no GIL) build of Python.
+    """
+    texts = list(texts)
+    if isinstance(script, str):
+        script = script_converters[script]
+    results = [None] * len(texts)
+    # (plan, [indices]) to convert in one go
+    jobs = []
+    # plan -> [[indices], total length]
+    groups = {}
+    for (index, text) in enumerate(texts):
+        (plan, results[index]) = _resolve_plan(text, script)
+        if plan is None:
+            continue
+        if len(text) >= group_size:
+            jobs.append((plan, [index]))
+            continue
+        group = groups.setdefault(plan, [[], 0])
+        group[0].append(index)
+        group[1] += len(text) + 1
+        if group[1] >= group_size:
+            jobs.append((plan, group[0]))
+            del groups[plan]
+    for (plan, (indices, _)) in groups.items():
+        jobs.append((plan, indices))
+
+    def convert_job(job):
+        return _convert_group(job[0], texts, job[1])
+
+    if executor is not None:
+        converted = executor.map(convert_job, jobs)
+    elif threads:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            converted = list(pool.map(convert_job, jobs))
+    else:
+        converted = map(convert_job, jobs)
+    for ((_, indices), job_results) in zip(jobs, converted):
+        for (index, result) in zip(indices, job_results):
+            results[index] = result
+    return results
+
+def _convert_group(plan, texts, indices):
+    """
+    Converts the texts at indices in one go; returns their results in the
+    same order. See convert_many()
+    """
+    if len(indices) == 1:
+        return [plan.convert(texts[indices[0]])]
+    lines = plan.convert("\n".join([texts[index] for index in indices]))[0]
+    lines = lines.split("\n")
+    results = []
+    start = 0
+    for index in indices:
+        end = start + texts[index].count("\n") + 1
+        braille = "\n".join(lines[start:end])
+        results.append((braille, append_warnings(braille)))
+        start = end
+    return results
+
+def iter_convert(chunks, script=None, warnings=None, block_size=65536,
+                 hold_limit=1 << 20):
+    """
+    Converts text that comes in pieces, yielding braille as it goes
+
+    chunks is an iterable of strings, or a file object opened in text mode
+    which is then read block_size characters at a time. The text can be split
+    anywhere: explicit schwa, akhand characters, virama-reversal and numbers
+    all work across pieces, and only the few characters they need to look at
+    are held back. See BrailleTransducer.feed().
+
+    script is the name of a script in script_converters, or a ScriptConverter.
+    If it is None, the script of the first Indic letter is used and
+    ScriptConflict is raised if a letter of any other script turns up later;
+    text before the first Indic letter is held back until then. At most
+    hold_limit characters are held: ValueError is raised if there is still
+    no Indic letter once more than that have come in. Pass the script for
+    such text.
+
+    If warnings is a list, the warnings are added to it once all the text has
+    been converted; BB_ERR_UNKNOWN_SCRIPT if no script was found. Their
+    offsets are into all of the braille yielded.
+    """
+    if hasattr(chunks, "read"):
+        chunks = iter(lambda read=chunks.read: read(block_size), "")
+    if isinstance(script, str):
+        script = script_converters[script]
+    transducer = None
+    if script is not None:
+        transducer = BrailleTransducer(script)
+    held = []
+    held_length = 0
+    for chunk in chunks:
+        if transducer is None:
+            match = script_detector.any_letter.search(chunk)
+            if not match:
+                held.append(chunk)
+                held_length += len(chunk)
+                if held_length > hold_limit:
+                    raise ValueError("No Indic letter within the first {0} "
+                                     "characters; pass script=".format(
+                                         hold_limit))
+                continue
+            plan = script_detector.script_of(match.group())
+            transducer = BrailleTransducer(
+                plan, script_detector.foreign_letters[plan.name])
+            chunk = ''.join(held) + chunk
+            held = None
+        braille = transducer.feed(chunk)
+        if braille:
+            yield braille
+    if transducer is None:
+        if warnings is not None:
+            warnings.extend(_no_braille_converter_found("")[1])
+        return
+    (braille, text_warnings) = transducer.finish()
+    if braille:
+        yield braille
+    if warnings is not None:
+        warnings.extend(text_warnings)
+
+
+def _convert_words(plan, words):
+    """
+    Converts words as split by ScriptConverter.word_pattern in one go;
+    returns a list of their braille, in order
+    """
+    # Words never have a newline in them
+    return plan.convert("\n".join(words))[0].split("\n")
+
+def convert_deduplicated(text, script=None):
+    """
+    Converts a large text by converting each distinct word in it only once;
+    returns the same as convert_any_indic_to_braille() (or
+    ScriptConverter.convert() if a script is given)
+
+    Words are split like WordCache does. Use this for one-off conversion of
+    long documents, which use far fewer distinct words than they have words.
+    """
+    (script, error) = _resolve_plan(text, script)
+    if error is not None:
+        return error
+    # Whitespace and words, alternating
+    parts = script.word_pattern.split(text)
+    vocabulary = dict.fromkeys(parts[1::2])
+    vocabulary = dict(zip(vocabulary, _convert_words(script, vocabulary)))
+    parts[1::2] = [vocabulary[word] for word in parts[1::2]]
+    braille = ''.join(parts)
+    return (braille, append_warnings(braille))
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+class WordCache(object):
+    """
+    Converts text a word at a time, remembering the braille for the most
+    recently used words
+
+    Each script gets its own cache of up to maxsize words (None for no
+    limit); the least recently used word is evicted when it is full. Words
+    are split at whitespace, across which no conversion rule looks (the
+    virama-reversal of a word that starts with a virama takes the space
+    before it along). Words that are not in the cache are converted together
+    in one go. The output is the same as that of ScriptConverter.convert().
+
+    A WordCache is not thread-safe; use one per thread.
+    """
+
+    def __init__(self, maxsize=8192):
+        self.maxsize = maxsize
+        # plan -> OrderedDict of word -> braille, least recently used first
+        self.words = {}
+        # plan -> [hits, misses, evictions]
+        self.counts = {}
+
+    def convert(self, text, script=None):
+        """
+        Converts the text; returns a (braille, warnings) tuple
+
+        script is the name of a script in script_converters, or a
+        ScriptConverter. If it is None, the script is detected like
+        convert_any_indic_to_braille() does.
+        """
+        (script, error) = _resolve_plan(text, script)
+        if error is not None:
+            return error
+        if script not in self.words:
+            self.words[script] = OrderedDict()
+            self.counts[script] = [0, 0, 0]
+        cache = self.words[script]
+        counts = self.counts[script]
+        # Whitespace and words, alternating
+        parts = script.word_pattern.split(text)
+        found = {}
+        missing = {}
+        for word in parts[1::2]:
+            if word in found or word in missing:
+                counts[0] += 1
+            elif word in cache:
+                cache.move_to_end(word)
+                found[word] = cache[word]
+                counts[0] += 1
+            else:
+                missing[word] = None
+                counts[1] += 1
+        if missing:
+            for (word, braille) in zip(missing,
+                                       _convert_words(script, missing)):
+                found[word] = braille
+                cache[word] = braille
+            if self.maxsize is not None:
+                while len(cache) > self.maxsize:
+                    cache.popitem(last=False)
+                    counts[2] += 1
+        parts[1::2] = [found[word] for word in parts[1::2]]
+        braille = ''.join(parts)
+        return (braille, append_warnings(braille))
+
+    def info(self, script=None):
+        """
+        Returns a CacheInfo with the hits, misses and evictions so far and the
+        number of words cached, for the given script or for all of them
+        """
+        if isinstance(script, str):
+            script = script_converters[script]
+        plans = [script] if script is not None else list(self.words)
+        (hits, misses, evictions, size) = (0, 0, 0, 0)
+        for plan in plans:
+            if plan in self.words:
+                hits += self.counts[plan][0]
+                misses += self.counts[plan][1]
+                evictions += self.counts[plan][2]
+                size += len(self.words[plan])
+        return CacheInfo(hits, misses, evictions, self.maxsize, size)
+
+    def clear(self):
+        "Empties the cache and resets the counts"
+        self.words.clear()
+        self.counts.clear()
+
+
+class BrailleDocument(object):
     """
-    text_set = frozenset(text)
-    indic_converter = None
-    # TODO: This is implemented in a very naïve manner and has bad O complexity
-    for charset, converter in converters.items():
-        if text_set & charset:
-            if indic_converter:
-                indic_converter = _multiple_braille_converters_found
+    A text and its braille, kept up to date as the text is edited
+
+    The text is held a line at a time, with the braille and a hash of each
+    line. No conversion rule looks across a newline, and conversion keeps
+    every newline, so each line converts on its own. apply_edit()
+    re-converts only the lines an edit touches, so it takes time in
+    proportion to those rather than to the whole text. Where lines start,
+    in the text and in the braille, is worked out lazily: an edit forgets
+    the starts of the lines after it, and they are worked out again only
+    as far as the next edit needs them.
+
+    script is the name of a script in script_converters, or a
+    ScriptConverter. A BrailleDocument is not thread-safe.
+    """
+
+    def __init__(self, text, script):
+        if isinstance(script, str):
+            script = script_converters[script]
+        self.plan = script
+        self._lines = text.split("\n")
+        self._braille = self._convert_lines(self._lines)
+        self._hashes = [hash(line) for line in self._lines]
+        # Where the lines start in the text and in the braille, as far as
+        # they have been worked out
+        self._starts = [0]
+        self._braille_starts = [0]
+
+    @property
+    def text(self):
+        return "\n".join(self._lines)
+
+    @property
+    def braille(self):
+        return "\n".join(self._braille)
+
+    @property
+    def warnings(self):
+        return append_warnings(self.braille)
+
+    def _convert_lines(self, lines):
+        "Converts the lines in one go; returns a list of their braille"
+        return self.plan.convert("\n".join(lines))[0].split("\n")
+
+    def _line_at(self, offset):
+        "Returns the index of the line that offset into the text falls in"
+        starts = self._starts
+        if offset < starts[-1]:
+            return bisect_right(starts, offset) - 1
+        (lines, braille) = (self._lines, self._braille)
+        braille_starts = self._braille_starts
+        index = len(starts) - 1
+        while index + 1 < len(lines) and \
+              starts[index] + len(lines[index]) < offset:
+            starts.append(starts[index] + len(lines[index]) + 1)
+            braille_starts.append(braille_starts[index] +
+                                  len(braille[index]) + 1)
+            index += 1
+        return index
+
+    def apply_edit(self, start, end, new_text):
+        """
+        Replaces text[start:end] with new_text and re-converts the lines
+        that touches. Returns (braille_start, braille_end, new_braille): the
+        old braille[braille_start:braille_end] has been replaced with
+        new_braille, so a copy of the braille can be patched the same way.
+        """
+        if not 0 <= start <= end:
+            raise ValueError("Bad edit range: {0}-{1}".format(start, end))
+        first = self._line_at(start)
+        last = self._line_at(end)
+        (lines, braille) = (self._lines, self._braille)
+        if end > self._starts[last] + len(lines[last]):
+            raise ValueError("Edit ends past the end of the text: {0}"
+                             .format(end))
+        new_lines = (lines[first][:start - self._starts[first]] + new_text +
+                     lines[last][end - self._starts[last]:]).split("\n")
+        new_hashes = [hash(line) for line in new_lines]
+        # Lines that are the same as before (say, the ones around a newline
+        # that has been typed) keep their braille
+        old = dict(zip(self._hashes[first:last+1],
+                       zip(lines[first:last+1], braille[first:last+1])))
+        reused = [old.get(line_hash, (None, None))
+                  for line_hash in new_hashes]
+        missing = [line for (line, (old_line, _)) in zip(new_lines, reused)
+                   if line != old_line]
+        converted = iter(self._convert_lines(missing) if missing else ())
+        new_braille = [cells if line == old_line else next(converted)
+                       for (line, (old_line, cells)) in zip(new_lines,
+                                                            reused)]
+        braille_start = self._braille_starts[first]
+        braille_end = self._braille_starts[last] + len(braille[last])
+        lines[first:last+1] = new_lines
+        braille[first:last+1] = new_braille
+        self._hashes[first:last+1] = new_hashes
+        del self._starts[first+1:]
+        del self._braille_starts[first+1:]
+        return (braille_start, braille_end, "\n".join(new_braille))
+
+
+# A stretch of text in a single script. Characters that belong to no script
+# (digits, punctuation, spaces, etc.) belong to the run they follow; the first
+# run starts at the beginning of the text.
+ScriptRun = namedtuple("ScriptRun", "script start end")
+
+class ScriptDetector(object):
+    """
+    Finds the Indic scripts used in a text, and where each one is used
+
+    Every letter of every script is looked up in a table indexed by codepoint
+    over the Indic Unicode blocks. The text is searched with compiled
+    character classes, so there is no need to build a set of the whole text,
+    and the search stops as soon as enough scripts have been seen.
+    """
+    BLOCK_START = 0x0900
+    BLOCK_END = 0x0E00
+
+    def __init__(self, script_letters, plans):
+        """
+        script_letters maps the name of each script to its letters; plans
+        maps the names to their ScriptConverter, and is only looked up once a
+        letter of that script has been found
+        """
+        self.plans = plans
+        table = [None] * (self.BLOCK_END - self.BLOCK_START)
+        letters = {}
+        for (name, chars) in script_letters.items():
+            letters[name] = sorted(char for char in chars if len(char) == 1)
+            for char in letters[name]:
+                table[ord(char) - self.BLOCK_START] = name
+        self.table = tuple(table)
+        self.any_letter = re.compile(self._char_class(
+            char for name in letters for char in letters[name]))
+        # Letters of every script but this one, by script name
+        self.foreign_letters = MappingProxyType(dict(
+            (name, frozenset(char for other in letters if other != name
+                                  for char in letters[other]))
+            for name in letters))
+        # Compiled from foreign_letters when first needed; see detect()
+        self.other_letters = {}
+
+    @staticmethod
+    def _char_class(chars):
+        return "[{0}]".format(re.escape(''.join(chars)))
+
+    def script_of(self, char):
+        "Returns the plan of the script the character is a letter of, if any"
+        index = ord(char) - self.BLOCK_START
+        if 0 <= index < len(self.table) and self.table[index] is not None:
+            return self.plans[self.table[index]]
+        return None
+
+    def detect(self, text, limit=None):
+        """
+        Returns the list of ScriptRun in the text; empty if there are no Indic
+        letters in it at all. If limit is given, stops looking once that many
+        runs have been found; the end of the last run is then None since the
+        rest of the text has not been looked at.
+        """
+        match = self.any_letter.search(text)
+        if not match:
+            return []
+        runs = []
+        (script, start) = (self.script_of(match.group()), 0)
+        while True:
+            if limit is not None and len(runs) + 1 == limit:
+                runs.append(ScriptRun(script, start, None))
                 break
-            indic_converter = converter
-    if not indic_converter:
-        indic_converter = _no_braille_converter_found
-    return indic_converter(text, debug)
-
-def _perform_mapping_pre_processing(consonants, vowels, akhand, composite_letters, various_signs):
-    """
-    Sets of all consonants and vowel *characters* (not maatras).
-    This list is used for the vowel idiosyncracy where 'LETTER A' is placed 
-    explicitly if a consonant is followed by a vowel character 
-    (not a vowel sign, which is a 'maatra')
-    See: insert_explicit_schwa()
-    """
-    all_consonants = set()
-    for each in consonants, akhand, composite_letters:
-        for value in each.values():
-            all_consonants.update(value)
-    vowel_chars = set()
-    all_consonants_and_vowels = set(all_consonants)
-    for value in vowels.values():
-        all_consonants_and_vowels.update(value)
-        length = len(value)
-        # We assume here that the first value is a vowel char, the second is a
-        # vowel sign, and that there are no more than two values
-        if length == 2:
-            vowel_chars.add(value[0])
-        elif length > 2:
-            raise Exception("Expected each Braille vowel to map from 2 vowels, but it's mapping from more than 2:\n{0}".format(vowels))
-    # Reverse all the braille-to-indic mappings from mappings.py
-    # We need a indic-to-bharati-braille mapping for each type of mapping
-    indic_to_bb = {}
-    for (braille, indic_list) in vowels.items() | consonants.items() | \
-                                 various_signs.items() | dashes.items():
-        for each in indic_list:
-            indic_to_bb[each] = braille
-    indic_to_bb_composite = {}
-    for (braille, devanagari_list) in akhand.items() | composite_letters.items():
-        for each in devanagari_list:
-            indic_to_bb_composite[each] = braille
-    return (all_consonants, frozenset(all_consonants_and_vowels), 
-            vowel_chars, indic_to_bb, indic_to_bb_composite)
+            other_letters = self.other_letters.get(script.name)
+            if other_letters is None:
+                other_letters = re.compile(self._char_class(
+                    sorted(self.foreign_letters[script.name])))
+                self.other_letters[script.name] = other_letters
+            match = other_letters.search(text, match.end())
+            if not match:
+                runs.append(ScriptRun(script, start, len(text)))
+                break
+            runs.append(ScriptRun(script, start, match.start()))
+            (script, start) = (self.script_of(match.group()), match.start())
+        return runs
+
+class ScriptConverters(Mapping):
+    """
+    The ScriptConverter of each script, by name; each one is only built the
+    first time it is looked up, so that programs that only convert one script
+    do not pay for building the others
+
+    mappings maps each name to the arguments for _build_script_converter().
+    """
+
+    def __init__(self, mappings):
+        self.mappings = mappings
+        self.built = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, name):
+        try:
+            return self.built[name]
+        except KeyError:
+            pass
+        mapping = self.mappings[name]
+        with self.lock:
+            if name not in self.built:
+                self.built[name] = _build_script_converter(name, *mapping)
+        return self.built[name]
+
+    def __iter__(self):
+        return iter(self.mappings)
+
+    def __len__(self):
+        return len(self.mappings)
+
+def _generated_script_tables(name):
+    """
+    The generated tables of the script; None if they are out of date or the
+    script is not in them, when they have to be built from the mappings
+    """
+    if not tables_up_to_date:
+        return None
+    return generated_tables.scripts.get(name)
+
+def _build_script_converter(name, schwa, virama, consonants, vowels, akhand,
+                            composite_letters, various_signs):
+    script_tables = _generated_script_tables(name)
+    if script_tables is not None:
+        (all_consonants, all_consonants_and_vowels, vowel_chars) = (
+            script_tables["all_consonants"],
+            script_tables["all_consonants_and_vowels"],
+            script_tables["vowel_chars"])
+        indic_to_bb = MappingProxyType(dict(script_tables["indic_to_bb"]))
+        indic_to_bb_composite = MappingProxyType(dict(
+            script_tables["indic_to_bb_composite"]))
+    else:
+        (all_consonants, all_consonants_and_vowels, vowel_chars, indic_to_bb,
+         indic_to_bb_composite) = _perform_mapping_pre_processing(
+            consonants, vowels, akhand, composite_letters, various_signs)
+    return ScriptConverter(schwa, virama, all_consonants, vowel_chars,
+                           indic_to_bb, indic_to_bb_composite, name,
+                           all_consonants_and_vowels)
+
+def _perform_class_pre_processing():
+    """
+    Returns the table of character classes: the CLASS_* bits of every
+    character of every script and of the common glyphs, by codepoint
+    """
+    char_bits = {}
+    def add(chars, char_class):
+        for char in chars:
+            if len(char) == 1:
+                char_bits[char] = char_bits.get(char, 0) | char_class
+    for (name, mapping) in script_mappings.items():
+        (_, virama, consonants, vowels, akhand, composite_letters,
+         various_signs) = mapping
+        script_tables = _generated_script_tables(name)
+        if script_tables is not None:
+            (all_consonants, vowel_chars, indic_to_bb,
+             indic_to_bb_composite) = (script_tables["all_consonants"],
+                                       script_tables["vowel_chars"],
+                                       script_tables["indic_to_bb"],
+                                       script_tables["indic_to_bb_composite"])
+        else:
+            (all_consonants, _, vowel_chars, indic_to_bb,
+             indic_to_bb_composite) = _perform_mapping_pre_processing(
+                consonants, vowels, akhand, composite_letters, various_signs)
+        add(''.join(all_consonants), CLASS_CONSONANT)
+        add(vowel_chars, CLASS_VOWEL_CHAR)
+        add([key[0] for key in indic_to_bb_composite], CLASS_COMPOSITE_START)
+        # See _perform_mapping_pre_processing() for the order of the values
+        add([value[1] for value in vowels.values() if len(value) == 2],
+            CLASS_VOWEL_SIGN)
+        add([char for (char, cells) in indic_to_bb.items()
+             if cells.startswith(virama)], CLASS_VIRAMA)
+    add(number_chars, CLASS_DIGIT)
+    add(".,", CLASS_NUMBER_PUNCTUATION)
+    add(cm_to_bb_punctuation, CLASS_PUNCTUATION)
+    add(dumb_quotes, CLASS_DUMB_QUOTE)
+    add(all_math_symbols, CLASS_MATH_SYMBOL)
+    classes = array("H", bytes(2 * (max(map(ord, char_bits)) + 1)))
+    for (char, char_class) in char_bits.items():
+        classes[ord(char)] = char_class
+    return classes
 
 ######################
 # BEGIN COMMON GLYPH #
 #   PRE-PROCESSING   #
 ######################
 # Set of all numbers. Used in translate_math()
-number_chars = set()
-for value in numbers.values():
-    number_chars.update(value)
+number_chars = frozenset(char for value in numbers.values() for char in value)
 
 # Set of all math symbols
-all_math_symbols = set()
-for value in math_symbols.values():
-    all_math_symbols.update(value)
-
-# Reverse all the bharati-braille-to-glyph mappings from mappings.py
-# We need a glyph-to-bharati-braille mapping for each type of mapping
-# This section converts all the characters common for all Indic scripts
-cm_to_bb_punctuation = {}
-for (braille, devanagari_list) in punctuation.items() | \
-                                  paired_punctuation.items() | dashes.items():
-    for each in devanagari_list:
-        cm_to_bb_punctuation[each] = braille
-cm_to_bb_numbers = {}
-for (braille, devanagari_list) in numbers.items():
-    for each in devanagari_list:
-        cm_to_bb_numbers[each] = braille
-cm_to_bb_math_punctuation = {}
-for (braille, devanagari_list) in math_punctuation.items():
-    for each in devanagari_list:
-        cm_to_bb_math_punctuation[each] = braille
+all_math_symbols = frozenset(char for value in math_symbols.values()
+                                  for char in value)
+
+# Used by split_text()
+whitespace_pattern = re.compile(r"\s")
+
+# The kinds of ConversionWarning for characters, and the characters for each
+warning_kinds = ((BB_WARN_DUMB_QUOTES, frozenset(dumb_quotes)),
+                 (BB_WARN_MATH_OPS, all_math_symbols))
+warning_char_kinds = MappingProxyType(dict((char, kind)
+                                           for (kind, chars) in warning_kinds
+                                           for char in chars))
+# Characters we warn about. Used in BrailleTransducer
+warning_chars = frozenset(warning_char_kinds)
+
+if tables_up_to_date:
+    (cm_to_bb_punctuation, cm_to_bb_numbers, cm_to_bb_math_punctuation) = (
+        dict(generated_tables.cm_to_bb_punctuation),
+        dict(generated_tables.cm_to_bb_numbers),
+        dict(generated_tables.cm_to_bb_math_punctuation))
+else:
+    (cm_to_bb_punctuation, cm_to_bb_numbers, cm_to_bb_math_punctuation) = \
+        _perform_common_pre_processing()
+cm_to_bb_punctuation_table = MappingProxyType(str.maketrans(
+                                                  cm_to_bb_punctuation))
+cm_to_bb_numbers_table = MappingProxyType(str.maketrans(cm_to_bb_numbers))
+cm_to_bb_punctuation = MappingProxyType(cm_to_bb_punctuation)
+cm_to_bb_numbers = MappingProxyType(cm_to_bb_numbers)
+cm_to_bb_math_punctuation = MappingProxyType(cm_to_bb_math_punctuation)
+# Characters that BrailleTransducer has to run through its common glyph
+# state machine; everything else is copied as-is
+common_glyph_chars = frozenset(cm_to_bb_punctuation) | number_chars | \
+                     warning_chars | frozenset(".,")
+
+# Regular expressions used by convert_common_glyphs_to_braille()
+_number_class = re.escape(''.join(sorted(number_chars)))
+# A fake ellipsis (...)
+ellipsis_pattern = re.compile(r"(?=[^.]?)(\.\.\.)(?=[^.]?)")
+## Match something that:
+## * Is a number «[{0}]+»
+## * Number may start with a decimal point
+## * Number may contain commas and/or more decimal points.
+number_pattern = re.compile(r"(\.?[{0}]+[{0}\.,]*)".format(_number_class),
+                            flags=re.MULTILINE)
+digit_pattern = re.compile(r"[{0}]".format(_number_class))
 
 ####################
 #    BEGIN INDIC   #
 #  PRE-PROCESSING  #
 ####################
-(all_dv_consonants, all_dv_consonants_and_vowels,
- dv_vowel_chars, dv_to_bb, dv_to_bb_composite) = \
-        _perform_mapping_pre_processing(dv_consonants, dv_vowels, dv_akhand,
-                                        dv_composite_letters, dv_various_signs)
-(all_gu_consonants, all_gu_consonants_and_vowels,
- gu_vowel_chars, gu_to_bb, gu_to_bb_composite) = \
-        _perform_mapping_pre_processing(gu_consonants, gu_vowels, gu_akhand,
-                                        gu_composite_letters, gu_various_signs)
-(all_bn_consonants, all_bn_consonants_and_vowels,
- bn_vowel_chars, bn_to_bb, bn_to_bb_composite) = \
-        _perform_mapping_pre_processing(bn_consonants, bn_vowels, bn_akhand, 
-                                        bn_composite_letters, bn_various_signs)
-(all_te_consonants, all_te_consonants_and_vowels,
- te_vowel_chars, te_to_bb, te_to_bb_composite) = \
-        _perform_mapping_pre_processing(te_consonants, te_vowels, te_akhand,
-                                        {}, te_various_signs)
-(all_ta_consonants, all_ta_consonants_and_vowels,
- ta_vowel_chars, ta_to_bb, ta_to_bb_composite) = \
-        _perform_mapping_pre_processing(ta_consonants, ta_vowels, ta_akhand,
-                                        {}, ta_various_signs)
-converters = {all_dv_consonants_and_vowels: convert_devanagari_to_braille,
-              all_gu_consonants_and_vowels: convert_gujarati_to_braille,
-              all_bn_consonants_and_vowels: convert_bengali_to_braille,
-              all_te_consonants_and_vowels: convert_telugu_to_braille,
-              all_ta_consonants_and_vowels: convert_tamil_to_braille,}
+script_converters = ScriptConverters(script_mappings)
+# CLASS_* bits of each character, by codepoint; see char_class_of()
+char_classes = _perform_class_pre_processing()
+
+def _detected_letters(name):
+    "The letters of the script, for ScriptDetector"
+    script_tables = _generated_script_tables(name)
+    if script_tables is not None:
+        return script_tables["all_consonants_and_vowels"]
+    return _script_letters(*script_mappings[name][2:6])
+
+script_detector = ScriptDetector(
+    dict((name, _detected_letters(name)) for name in script_mappings),
+    script_converters)
+
+# The tables that used to be built at import time for each script, such as
+# dv_converter, all_dv_consonants or dv_to_bb, are still available as module
+# attributes; they are built when first looked up.
+_script_attributes = {
+    "{0}_converter": None,
+    "all_{0}_consonants": "all_consonants",
+    "all_{0}_consonants_and_vowels": "letters",
+    "{0}_vowel_chars": "vowel_chars",
+    "{0}_to_bb": "indic_to_bb",
+    "{0}_to_bb_composite": "indic_to_bb_composite",
+}
+_lazy_attributes = dict((template.format(name), (name, attribute))
+                        for (template, attribute) in _script_attributes.items()
+                        for name in script_mappings)
+
+def __getattr__(name):
+    if name not in _lazy_attributes:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(
+                             __name__, name))
+    (script, attribute) = _lazy_attributes[name]
+    plan = script_converters[script]
+    if attribute is None:
+        return plan
+    return getattr(plan, attribute)
+
 ######################
 # END PRE-PROCESSING #
 ######################
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim: set sts=4 sw=4 et tw=0 :
+#
+# License:
+#  AGPL-3.0
+#  http://www.gnu.org/licenses/agpl-3.0.html
+#
+# Writes backend/tables.py: the tables that converters.py builds from the
+# mappings, as Python literals. converters.py imports them from there instead
+# of building them, and the file shows exactly what changes when a mapping
+# does. Along with them goes a hash of the mappings; converters.py does not
+# use the tables once that no longer matches, or for a script not in them.
+#
+# Run from the top-level directory after changing anything in
+# backend/mappings/: python3 -m backend.generate_tables
+# With --check, only checks that backend/tables.py is up to date.
+#
+
+import os
+import sys
+
+from backend.preprocessing import script_mappings, mappings_hash
+from backend.preprocessing import _perform_common_pre_processing
+from backend.preprocessing import _perform_mapping_pre_processing
+
+if sys.version_info.major != 3:
+    raise Exception("This program needs Python 3!")
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "tables.py")
+
+HEADER = """\
+# -*- coding: utf-8 -*-
+#
+# Generated from backend/mappings/ by backend/generate_tables.py; do not edit.
+# Run python3 -m backend.generate_tables after changing the mappings. The
+# tests check that this file is up to date.
+#
+"""
+
+def _codepoints(string):
+    return " ".join("U+{0:04X}".format(ord(char)) for char in string)
+
+def _format_dict(mapping, indent):
+    lines = ["{"]
+    for key in sorted(mapping):
+        lines.append("{0}    {1!r}: {2!r},  # {3}".format(
+                     indent, key, mapping[key], _codepoints(key)))
+    lines.append(indent + "}")
+    return "\n".join(lines)
+
+def _format_set(chars, indent):
+    lines = ["frozenset(["]
+    for char in sorted(chars):
+        lines.append("{0}    {1!r},  # {2}".format(indent, char,
+                                                  _codepoints(char)))
+    lines.append(indent + "])")
+    return "\n".join(lines)
+
+def generate():
+    "Returns the source of backend/tables.py"
+    parts = [HEADER]
+    parts.append("# See backend.preprocessing.mappings_hash()\n"
+                 "mappings_hash = {0!r}\n".format(mappings_hash()))
+    names = ("cm_to_bb_punctuation", "cm_to_bb_numbers",
+             "cm_to_bb_math_punctuation")
+    for (name, mapping) in zip(names, _perform_common_pre_processing()):
+        parts.append("{0} = {1}\n".format(name, _format_dict(mapping, "")))
+    parts.append("scripts = {")
+    names = ("all_consonants", "all_consonants_and_vowels", "vowel_chars",
+             "indic_to_bb", "indic_to_bb_composite")
+    for (script, mapping) in script_mappings.items():
+        parts.append("    {0!r}: {{".format(script))
+        for (name, table) in zip(names,
+                                 _perform_mapping_pre_processing(*mapping[2:])):
+            if isinstance(table, frozenset):
+                table = _format_set(table, " " * 8)
+            else:
+                table = _format_dict(table, " " * 8)
+            parts.append("        {0!r}: {1},".format(name, table))
+        parts.append("    },")
+    parts.append("}\n")
+    return "\n".join(parts)
+
+def main(argv):
+    source = generate()
+    if "--check" in argv:
+        try:
+            with open(TABLES_PATH, encoding="utf-8") as tables:
+                current = tables.read()
+        except OSError:
+            current = None
+        if current != source:
+            print("{0} is out of date; run python3 -m backend.generate_tables"
+                  .format(TABLES_PATH))
+            return 1
+        return 0
+    with open(TABLES_PATH, "w", encoding="utf-8") as tables:
+        tables.write(source)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
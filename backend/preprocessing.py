@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim: set sts=4 sw=4 et tw=0 :
+#
+# License:
+#  AGPL-3.0
+#  http://www.gnu.org/licenses/agpl-3.0.html
+#
+# Builds the tables that converters.py needs from the mappings. It is kept
+# apart from converters.py so that generate_tables.py can build the tables
+# without importing the generated ones, which may be out of date or missing
+# a script.
+#
+
+import hashlib
+import os
+import sys
+from types import MappingProxyType
+
+if sys.version_info.major != 3:
+    raise Exception("This program needs Python 3!")
+
+# Characters common to all encodings
+from .mappings.common import dashes, punctuation, paired_punctuation
+from .mappings.common import numbers, math_punctuation
+
+# Devanagari mappings
+from .mappings.dv import dv_virama, dv_schwa, dv_composite_letters, dv_akhand
+from .mappings.dv import dv_vowels, dv_consonants, dv_various_signs
+# Gujarati mappings
+from .mappings.gu import gu_virama, gu_schwa, gu_composite_letters, gu_akhand
+from .mappings.gu import gu_vowels, gu_consonants, gu_various_signs
+# Bengali mappings
+from .mappings.bn import bn_virama, bn_schwa, bn_composite_letters, bn_akhand
+from .mappings.bn import bn_vowels, bn_consonants, bn_various_signs
+# Telugu mappings
+from .mappings.te import te_virama, te_schwa, te_akhand
+from .mappings.te import te_vowels, te_consonants, te_various_signs
+# Tamil mappings
+from .mappings.ta import ta_virama, ta_schwa, ta_akhand
+from .mappings.ta import ta_vowels, ta_consonants, ta_various_signs
+
+# The mappings of each script; the tables for a script are only built when
+# it is first used, see ScriptConverters in converters.py
+script_mappings = MappingProxyType({
+    "dv": (dv_schwa, dv_virama, dv_consonants, dv_vowels, dv_akhand,
+           dv_composite_letters, dv_various_signs),
+    "gu": (gu_schwa, gu_virama, gu_consonants, gu_vowels, gu_akhand,
+           gu_composite_letters, gu_various_signs),
+    "bn": (bn_schwa, bn_virama, bn_consonants, bn_vowels, bn_akhand,
+           bn_composite_letters, bn_various_signs),
+    "te": (te_schwa, te_virama, te_consonants, te_vowels, te_akhand,
+           {}, te_various_signs),
+    "ta": (ta_schwa, ta_virama, ta_consonants, ta_vowels, ta_akhand,
+           {}, ta_various_signs),
+})
+
+def _script_letters(consonants, vowels, akhand, composite_letters):
+    """
+    The single characters in all_consonants_and_vowels, without doing the
+    rest of the pre-processing; used for script detection
+    """
+    return frozenset(char for each in (consonants, vowels, akhand,
+                                       composite_letters)
+                          for value in each.values()
+                          for char in value if len(char) == 1)
+
+def _perform_common_pre_processing():
+    """
+    Reverse all the bharati-braille-to-glyph mappings from mappings.py
+    We need a glyph-to-bharati-braille mapping for each type of mapping
+    This section converts all the characters common for all Indic scripts
+    """
+    cm_to_bb_punctuation = {}
+    for mapping in (punctuation, paired_punctuation, dashes):
+        for (braille, glyph_list) in mapping.items():
+            for each in glyph_list:
+                cm_to_bb_punctuation.setdefault(each, braille)
+    cm_to_bb_numbers = {}
+    for (braille, glyph_list) in numbers.items():
+        for each in glyph_list:
+            cm_to_bb_numbers.setdefault(each, braille)
+    cm_to_bb_math_punctuation = {}
+    for (braille, glyph_list) in math_punctuation.items():
+        for each in glyph_list:
+            cm_to_bb_math_punctuation.setdefault(each, braille)
+    return (cm_to_bb_punctuation, cm_to_bb_numbers, cm_to_bb_math_punctuation)
+
+
+def _perform_mapping_pre_processing(consonants, vowels, akhand, composite_letters, various_signs):
+    """
+    Sets of all consonants and vowel *characters* (not maatras).
+    This list is used for the vowel idiosyncracy where 'LETTER A' is placed 
+    explicitly if a consonant is followed by a vowel character 
+    (not a vowel sign, which is a 'maatra')
+    See: insert_explicit_schwa()
+    """
+    all_consonants = set()
+    for each in consonants, akhand, composite_letters:
+        for value in each.values():
+            all_consonants.update(value)
+    vowel_chars = set()
+    all_consonants_and_vowels = set(all_consonants)
+    for value in vowels.values():
+        all_consonants_and_vowels.update(value)
+        length = len(value)
+        # We assume here that the first value is a vowel char, the second is a
+        # vowel sign, and that there are no more than two values
+        if length == 2:
+            vowel_chars.add(value[0])
+        elif length > 2:
+            raise Exception("Expected each Braille vowel to map from 2 vowels, but it's mapping from more than 2:\n{0}".format(vowels))
+    # Reverse all the braille-to-indic mappings from mappings.py
+    # We need a indic-to-bharati-braille mapping for each type of mapping
+    # If a character is in more than one mapping, the first one is used
+    indic_to_bb = {}
+    for mapping in (vowels, consonants, various_signs, dashes):
+        for (braille, indic_list) in mapping.items():
+            for each in indic_list:
+                indic_to_bb.setdefault(each, braille)
+    indic_to_bb_composite = {}
+    for mapping in (akhand, composite_letters):
+        for (braille, devanagari_list) in mapping.items():
+            for each in devanagari_list:
+                indic_to_bb_composite.setdefault(each, braille)
+    return (frozenset(all_consonants), frozenset(all_consonants_and_vowels),
+            frozenset(vowel_chars), MappingProxyType(indic_to_bb),
+            MappingProxyType(indic_to_bb_composite))
+
+def mappings_hash():
+    """
+    Returns a hash of the sources the tables are built from: the mappings and
+    this module. generate_tables.py writes it into tables.py, and the tables
+    there are only used while it still matches. None if the sources cannot be
+    read, which matches no tables.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    mappings = os.path.join(directory, "mappings")
+    digest = hashlib.sha256()
+    try:
+        paths = [os.path.join(mappings, name)
+                 for name in sorted(os.listdir(mappings))
+                 if name.endswith(".py")]
+        paths.append(os.path.join(directory, "preprocessing.py"))
+        for path in paths:
+            with open(path, "rb") as source:
+                # The same on a checkout with Windows line endings
+                text = source.read().replace(b"\r\n", b"\n")
+            digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+            digest.update(text + b"\0")
+    except OSError:
+        return None
+    return digest.hexdigest()
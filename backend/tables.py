@@ -0,0 +1,1121 @@
+# -*- coding: utf-8 -*-
+#
+# Generated from backend/mappings/ by backend/generate_tables.py; do not edit.
+# Run python3 -m backend.generate_tables after changing the mappings. The
+# tests check that this file is up to date.
+#
+
+# See backend.preprocessing.mappings_hash()
+mappings_hash = '18a99febaec44c8adcc2c2fc2f88d20c29b95728460b87709acfd2a878a94a6f'
+
+cm_to_bb_punctuation = {
+    '!': '⠖',  # U+0021
+    '(': '⠶',  # U+0028
+    ')': '⠶',  # U+0029
+    '*': '⠔⠔',  # U+002A
+    ',': '⠂',  # U+002C
+    '-': '⠤',  # U+002D
+    ':': '⠒',  # U+003A
+    ';': '⠆',  # U+003B
+    '?': '⠦',  # U+003F
+    '[': '⠠⠶',  # U+005B
+    ']': '⠶⠄',  # U+005D
+    '।': '⠲',  # U+0964
+    '॥': '⠲⠲',  # U+0965
+    '‐': '⠤',  # U+2010
+    '–': '⠤⠤',  # U+2013
+    '—': '⠤⠤⠤⠤',  # U+2014
+    '‘': '⠠⠦',  # U+2018
+    '’': '⠴⠄',  # U+2019
+    '“': '⠦',  # U+201C
+    '”': '⠴',  # U+201D
+    '…': '⠠⠠⠠',  # U+2026
+}
+
+cm_to_bb_numbers = {
+    '0': '⠚',  # U+0030
+    '1': '⠁',  # U+0031
+    '2': '⠃',  # U+0032
+    '3': '⠉',  # U+0033
+    '4': '⠙',  # U+0034
+    '5': '⠑',  # U+0035
+    '6': '⠋',  # U+0036
+    '7': '⠛',  # U+0037
+    '8': '⠓',  # U+0038
+    '9': '⠊',  # U+0039
+    '०': '⠚',  # U+0966
+    '१': '⠁',  # U+0967
+    '२': '⠃',  # U+0968
+    '३': '⠉',  # U+0969
+    '४': '⠙',  # U+096A
+    '५': '⠑',  # U+096B
+    '६': '⠋',  # U+096C
+    '७': '⠛',  # U+096D
+    '८': '⠓',  # U+096E
+    '९': '⠊',  # U+096F
+    '০': '⠚',  # U+09E6
+    '১': '⠁',  # U+09E7
+    '২': '⠃',  # U+09E8
+    '৩': '⠉',  # U+09E9
+    '৪': '⠙',  # U+09EA
+    '৫': '⠑',  # U+09EB
+    '৬': '⠋',  # U+09EC
+    '৭': '⠛',  # U+09ED
+    '৮': '⠓',  # U+09EE
+    '৯': '⠊',  # U+09EF
+    '૦': '⠚',  # U+0AE6
+    '૧': '⠁',  # U+0AE7
+    '૨': '⠃',  # U+0AE8
+    '૩': '⠉',  # U+0AE9
+    '૪': '⠙',  # U+0AEA
+    '૫': '⠑',  # U+0AEB
+    '૬': '⠋',  # U+0AEC
+    '૭': '⠛',  # U+0AED
+    '૮': '⠓',  # U+0AEE
+    '૯': '⠊',  # U+0AEF
+    '௦': '⠚',  # U+0BE6
+    '௧': '⠁',  # U+0BE7
+    '௨': '⠃',  # U+0BE8
+    '௩': '⠉',  # U+0BE9
+    '௪': '⠙',  # U+0BEA
+    '௫': '⠑',  # U+0BEB
+    '௬': '⠋',  # U+0BEC
+    '௭': '⠛',  # U+0BED
+    '௮': '⠓',  # U+0BEE
+    '௯': '⠊',  # U+0BEF
+    '౦': '⠚',  # U+0C66
+    '౧': '⠁',  # U+0C67
+    '౨': '⠃',  # U+0C68
+    '౩': '⠉',  # U+0C69
+    '౪': '⠙',  # U+0C6A
+    '౫': '⠑',  # U+0C6B
+    '౬': '⠋',  # U+0C6C
+    '౭': '⠛',  # U+0C6D
+    '౮': '⠓',  # U+0C6E
+    '౯': '⠊',  # U+0C6F
+}
+
+cm_to_bb_math_punctuation = {
+    ',': '⠠',  # U+002C
+    '.': '⠨',  # U+002E
+}
+
+scripts = {
+    'dv': {
+        'all_consonants': frozenset([
+            'क',  # U+0915
+            'क़',  # U+0915 U+093C
+            'क्ष',  # U+0915 U+094D U+0937
+            'ख',  # U+0916
+            'ख़',  # U+0916 U+093C
+            'ग',  # U+0917
+            'ग़',  # U+0917 U+093C
+            'घ',  # U+0918
+            'ङ',  # U+0919
+            'च',  # U+091A
+            'छ',  # U+091B
+            'ज',  # U+091C
+            'ज़',  # U+091C U+093C
+            'ज्ञ',  # U+091C U+094D U+091E
+            'झ',  # U+091D
+            'ञ',  # U+091E
+            'ट',  # U+091F
+            'ठ',  # U+0920
+            'ड',  # U+0921
+            'ड़',  # U+0921 U+093C
+            'ढ',  # U+0922
+            'ढ़',  # U+0922 U+093C
+            'ण',  # U+0923
+            'त',  # U+0924
+            'थ',  # U+0925
+            'द',  # U+0926
+            'ध',  # U+0927
+            'न',  # U+0928
+            'ऩ',  # U+0928 U+093C
+            'ऩ',  # U+0929
+            'प',  # U+092A
+            'फ',  # U+092B
+            'फ़',  # U+092B U+093C
+            'ब',  # U+092C
+            'भ',  # U+092D
+            'म',  # U+092E
+            'य',  # U+092F
+            'य़',  # U+092F U+093C
+            'र',  # U+0930
+            'ऱ',  # U+0930 U+093C
+            'ऱ',  # U+0931
+            'ल',  # U+0932
+            'ळ',  # U+0933
+            'ऴ',  # U+0933 U+093C
+            'ऴ',  # U+0934
+            'व',  # U+0935
+            'श',  # U+0936
+            'ष',  # U+0937
+            'स',  # U+0938
+            'ह',  # U+0939
+            'क़',  # U+0958
+            'ख़',  # U+0959
+            'ग़',  # U+095A
+            'ज़',  # U+095B
+            'ड़',  # U+095C
+            'ढ़',  # U+095D
+            'फ़',  # U+095E
+            'य़',  # U+095F
+        ]),
+        'all_consonants_and_vowels': frozenset([
+            'अ',  # U+0905
+            'आ',  # U+0906
+            'इ',  # U+0907
+            'ई',  # U+0908
+            'उ',  # U+0909
+            'ऊ',  # U+090A
+            'ऋ',  # U+090B
+            'ऌ',  # U+090C
+            'ऍ',  # U+090D
+            'ए',  # U+090F
+            'ऐ',  # U+0910
+            'ऑ',  # U+0911
+            'ओ',  # U+0913
+            'औ',  # U+0914
+            'क',  # U+0915
+            'क़',  # U+0915 U+093C
+            'क्ष',  # U+0915 U+094D U+0937
+            'ख',  # U+0916
+            'ख़',  # U+0916 U+093C
+            'ग',  # U+0917
+            'ग़',  # U+0917 U+093C
+            'घ',  # U+0918
+            'ङ',  # U+0919
+            'च',  # U+091A
+            'छ',  # U+091B
+            'ज',  # U+091C
+            'ज़',  # U+091C U+093C
+            'ज्ञ',  # U+091C U+094D U+091E
+            'झ',  # U+091D
+            'ञ',  # U+091E
+            'ट',  # U+091F
+            'ठ',  # U+0920
+            'ड',  # U+0921
+            'ड़',  # U+0921 U+093C
+            'ढ',  # U+0922
+            'ढ़',  # U+0922 U+093C
+            'ण',  # U+0923
+            'त',  # U+0924
+            'थ',  # U+0925
+            'द',  # U+0926
+            'ध',  # U+0927
+            'न',  # U+0928
+            'ऩ',  # U+0928 U+093C
+            'ऩ',  # U+0929
+            'प',  # U+092A
+            'फ',  # U+092B
+            'फ़',  # U+092B U+093C
+            'ब',  # U+092C
+            'भ',  # U+092D
+            'म',  # U+092E
+            'य',  # U+092F
+            'य़',  # U+092F U+093C
+            'र',  # U+0930
+            'ऱ',  # U+0930 U+093C
+            'ऱ',  # U+0931
+            'ल',  # U+0932
+            'ळ',  # U+0933
+            'ऴ',  # U+0933 U+093C
+            'ऴ',  # U+0934
+            'व',  # U+0935
+            'श',  # U+0936
+            'ष',  # U+0937
+            'स',  # U+0938
+            'ह',  # U+0939
+            'ा',  # U+093E
+            'ि',  # U+093F
+            'ी',  # U+0940
+            'ु',  # U+0941
+            'ू',  # U+0942
+            'ृ',  # U+0943
+            'ॄ',  # U+0944
+            'ॅ',  # U+0945
+            'े',  # U+0947
+            'ै',  # U+0948
+            'ॉ',  # U+0949
+            'ो',  # U+094B
+            'ौ',  # U+094C
+            'क़',  # U+0958
+            'ख़',  # U+0959
+            'ग़',  # U+095A
+            'ज़',  # U+095B
+            'ड़',  # U+095C
+            'ढ़',  # U+095D
+            'फ़',  # U+095E
+            'य़',  # U+095F
+            'ॠ',  # U+0960
+            'ॡ',  # U+0961
+            'ॢ',  # U+0962
+            'ॣ',  # U+0963
+        ]),
+        'vowel_chars': frozenset([
+            'आ',  # U+0906
+            'इ',  # U+0907
+            'ई',  # U+0908
+            'उ',  # U+0909
+            'ऊ',  # U+090A
+            'ऋ',  # U+090B
+            'ऌ',  # U+090C
+            'ऍ',  # U+090D
+            'ए',  # U+090F
+            'ऐ',  # U+0910
+            'ऑ',  # U+0911
+            'ओ',  # U+0913
+            'औ',  # U+0914
+            'ॠ',  # U+0960
+            'ॡ',  # U+0961
+        ]),
+        'indic_to_bb': {
+            '-': '⠤',  # U+002D
+            'ँ': '⠄',  # U+0901
+            'ं': '⠰',  # U+0902
+            'ः': '⠠',  # U+0903
+            'अ': '⠁',  # U+0905
+            'आ': '⠜',  # U+0906
+            'इ': '⠊',  # U+0907
+            'ई': '⠔',  # U+0908
+            'उ': '⠥',  # U+0909
+            'ऊ': '⠳',  # U+090A
+            'ऋ': '⠐⠗',  # U+090B
+            'ऌ': '⠐⠇',  # U+090C
+            'ऍ': '⠢',  # U+090D
+            'ए': '⠑',  # U+090F
+            'ऐ': '⠌',  # U+0910
+            'ऑ': '⠭',  # U+0911
+            'ओ': '⠕',  # U+0913
+            'औ': '⠪',  # U+0914
+            'क': '⠅',  # U+0915
+            'ख': '⠨',  # U+0916
+            'ग': '⠛',  # U+0917
+            'घ': '⠣',  # U+0918
+            'ङ': '⠬',  # U+0919
+            'च': '⠉',  # U+091A
+            'छ': '⠡',  # U+091B
+            'ज': '⠚',  # U+091C
+            'झ': '⠴',  # U+091D
+            'ञ': '⠒',  # U+091E
+            'ट': '⠾',  # U+091F
+            'ठ': '⠺',  # U+0920
+            'ड': '⠫',  # U+0921
+            'ढ': '⠿',  # U+0922
+            'ण': '⠼',  # U+0923
+            'त': '⠞',  # U+0924
+            'थ': '⠹',  # U+0925
+            'द': '⠙',  # U+0926
+            'ध': '⠮',  # U+0927
+            'न': '⠝',  # U+0928
+            'ऩ': '⠝',  # U+0929
+            'प': '⠏',  # U+092A
+            'फ': '⠖',  # U+092B
+            'ब': '⠃',  # U+092C
+            'भ': '⠘',  # U+092D
+            'म': '⠍',  # U+092E
+            'य': '⠽',  # U+092F
+            'र': '⠗',  # U+0930
+            'ऱ': '⠗',  # U+0931
+            'ल': '⠇',  # U+0932
+            'ळ': '⠸',  # U+0933
+            'ऴ': '⠸',  # U+0934
+            'व': '⠧',  # U+0935
+            'श': '⠩',  # U+0936
+            'ष': '⠯',  # U+0937
+            'स': '⠎',  # U+0938
+            'ह': '⠓',  # U+0939
+            '़': '',  # U+093C
+            'ऽ': '⠂',  # U+093D
+            'ा': '⠜',  # U+093E
+            'ि': '⠊',  # U+093F
+            'ी': '⠔',  # U+0940
+            'ु': '⠥',  # U+0941
+            'ू': '⠳',  # U+0942
+            'ृ': '⠐⠗',  # U+0943
+            'ॄ': '⠠⠗',  # U+0944
+            'ॅ': '⠢',  # U+0945
+            'े': '⠑',  # U+0947
+            'ै': '⠌',  # U+0948
+            'ॉ': '⠭',  # U+0949
+            'ो': '⠕',  # U+094B
+            'ौ': '⠪',  # U+094C
+            '्': '⠈',  # U+094D
+            'क़': '⠅',  # U+0958
+            'ख़': '⠨',  # U+0959
+            'ग़': '⠛',  # U+095A
+            'ज़': '⠚',  # U+095B
+            'ड़': '⠻',  # U+095C
+            'ढ़': '⠐⠻',  # U+095D
+            'फ़': '⠖',  # U+095E
+            'य़': '⠽',  # U+095F
+            'ॠ': '⠠⠗',  # U+0960
+            'ॡ': '⠠⠇',  # U+0961
+            'ॢ': '⠐⠇',  # U+0962
+            'ॣ': '⠠⠇',  # U+0963
+            '‐': '⠤',  # U+2010
+            '–': '⠤⠤',  # U+2013
+            '—': '⠤⠤⠤⠤',  # U+2014
+        },
+        'indic_to_bb_composite': {
+            'क़': '⠅',  # U+0915 U+093C
+            'क्ष': '⠟',  # U+0915 U+094D U+0937
+            'ख़': '⠨',  # U+0916 U+093C
+            'ग़': '⠛',  # U+0917 U+093C
+            'ज़': '⠚',  # U+091C U+093C
+            'ज्ञ': '⠱',  # U+091C U+094D U+091E
+            'ड़': '⠻',  # U+0921 U+093C
+            'ढ़': '⠐⠻',  # U+0922 U+093C
+            'ऩ': '⠝',  # U+0928 U+093C
+            'फ़': '⠖',  # U+092B U+093C
+            'य़': '⠽',  # U+092F U+093C
+            'ऱ': '⠗',  # U+0930 U+093C
+            'ऴ': '⠸',  # U+0933 U+093C
+        },
+    },
+    'gu': {
+        'all_consonants': frozenset([
+            'ક',  # U+0A95
+            'ક્ષ',  # U+0A95 U+0ACD U+0AB7
+            'ખ',  # U+0A96
+            'ગ',  # U+0A97
+            'ઘ',  # U+0A98
+            'ઙ',  # U+0A99
+            'ચ',  # U+0A9A
+            'છ',  # U+0A9B
+            'જ',  # U+0A9C
+            'જ્ઞ',  # U+0A9C U+0ACD U+0A9E
+            'ઝ',  # U+0A9D
+            'ઞ',  # U+0A9E
+            'ટ',  # U+0A9F
+            'ઠ',  # U+0AA0
+            'ડ',  # U+0AA1
+            'ઢ',  # U+0AA2
+            'ણ',  # U+0AA3
+            'ત',  # U+0AA4
+            'થ',  # U+0AA5
+            'દ',  # U+0AA6
+            'ધ',  # U+0AA7
+            'ન',  # U+0AA8
+            'પ',  # U+0AAA
+            'ફ',  # U+0AAB
+            'બ',  # U+0AAC
+            'ભ',  # U+0AAD
+            'મ',  # U+0AAE
+            'ય',  # U+0AAF
+            'ર',  # U+0AB0
+            'લ',  # U+0AB2
+            'ળ',  # U+0AB3
+            'વ',  # U+0AB5
+            'શ',  # U+0AB6
+            'ષ',  # U+0AB7
+            'સ',  # U+0AB8
+            'હ',  # U+0AB9
+        ]),
+        'all_consonants_and_vowels': frozenset([
+            'અ',  # U+0A85
+            'આ',  # U+0A86
+            'ઇ',  # U+0A87
+            'ઈ',  # U+0A88
+            'ઉ',  # U+0A89
+            'ઊ',  # U+0A8A
+            'ઋ',  # U+0A8B
+            'ઍ',  # U+0A8D
+            'એ',  # U+0A8F
+            'ઐ',  # U+0A90
+            'ઑ',  # U+0A91
+            'ઓ',  # U+0A93
+            'ઔ',  # U+0A94
+            'ક',  # U+0A95
+            'ક્ષ',  # U+0A95 U+0ACD U+0AB7
+            'ખ',  # U+0A96
+            'ગ',  # U+0A97
+            'ઘ',  # U+0A98
+            'ઙ',  # U+0A99
+            'ચ',  # U+0A9A
+            'છ',  # U+0A9B
+            'જ',  # U+0A9C
+            'જ્ઞ',  # U+0A9C U+0ACD U+0A9E
+            'ઝ',  # U+0A9D
+            'ઞ',  # U+0A9E
+            'ટ',  # U+0A9F
+            'ઠ',  # U+0AA0
+            'ડ',  # U+0AA1
+            'ઢ',  # U+0AA2
+            'ણ',  # U+0AA3
+            'ત',  # U+0AA4
+            'થ',  # U+0AA5
+            'દ',  # U+0AA6
+            'ધ',  # U+0AA7
+            'ન',  # U+0AA8
+            'પ',  # U+0AAA
+            'ફ',  # U+0AAB
+            'બ',  # U+0AAC
+            'ભ',  # U+0AAD
+            'મ',  # U+0AAE
+            'ય',  # U+0AAF
+            'ર',  # U+0AB0
+            'લ',  # U+0AB2
+            'ળ',  # U+0AB3
+            'વ',  # U+0AB5
+            'શ',  # U+0AB6
+            'ષ',  # U+0AB7
+            'સ',  # U+0AB8
+            'હ',  # U+0AB9
+            'ા',  # U+0ABE
+            'િ',  # U+0ABF
+            'ી',  # U+0AC0
+            'ુ',  # U+0AC1
+            'ૂ',  # U+0AC2
+            'ૃ',  # U+0AC3
+            'ૄ',  # U+0AC4
+            'ૅ',  # U+0AC5
+            'ે',  # U+0AC7
+            'ૈ',  # U+0AC8
+            'ૉ',  # U+0AC9
+            'ો',  # U+0ACB
+            'ૌ',  # U+0ACC
+            'ૠ',  # U+0AE0
+        ]),
+        'vowel_chars': frozenset([
+            'આ',  # U+0A86
+            'ઇ',  # U+0A87
+            'ઈ',  # U+0A88
+            'ઉ',  # U+0A89
+            'ઊ',  # U+0A8A
+            'ઋ',  # U+0A8B
+            'ઍ',  # U+0A8D
+            'એ',  # U+0A8F
+            'ઐ',  # U+0A90
+            'ઑ',  # U+0A91
+            'ઓ',  # U+0A93
+            'ઔ',  # U+0A94
+            'ૠ',  # U+0AE0
+        ]),
+        'indic_to_bb': {
+            '-': '⠤',  # U+002D
+            'ઁ': '⠄',  # U+0A81
+            'ં': '⠰',  # U+0A82
+            'ઃ': '⠠',  # U+0A83
+            'અ': '⠁',  # U+0A85
+            'આ': '⠜',  # U+0A86
+            'ઇ': '⠊',  # U+0A87
+            'ઈ': '⠔',  # U+0A88
+            'ઉ': '⠥',  # U+0A89
+            'ઊ': '⠳',  # U+0A8A
+            'ઋ': '⠐⠗',  # U+0A8B
+            'ઍ': '⠢',  # U+0A8D
+            'એ': '⠑',  # U+0A8F
+            'ઐ': '⠌',  # U+0A90
+            'ઑ': '⠭',  # U+0A91
+            'ઓ': '⠕',  # U+0A93
+            'ઔ': '⠪',  # U+0A94
+            'ક': '⠅',  # U+0A95
+            'ખ': '⠨',  # U+0A96
+            'ગ': '⠛',  # U+0A97
+            'ઘ': '⠣',  # U+0A98
+            'ઙ': '⠬',  # U+0A99
+            'ચ': '⠉',  # U+0A9A
+            'છ': '⠡',  # U+0A9B
+            'જ': '⠚',  # U+0A9C
+            'ઝ': '⠴',  # U+0A9D
+            'ઞ': '⠒',  # U+0A9E
+            'ટ': '⠾',  # U+0A9F
+            'ઠ': '⠺',  # U+0AA0
+            'ડ': '⠫',  # U+0AA1
+            'ઢ': '⠿',  # U+0AA2
+            'ણ': '⠼',  # U+0AA3
+            'ત': '⠞',  # U+0AA4
+            'થ': '⠹',  # U+0AA5
+            'દ': '⠙',  # U+0AA6
+            'ધ': '⠮',  # U+0AA7
+            'ન': '⠝',  # U+0AA8
+            'પ': '⠏',  # U+0AAA
+            'ફ': '⠖',  # U+0AAB
+            'બ': '⠃',  # U+0AAC
+            'ભ': '⠘',  # U+0AAD
+            'મ': '⠍',  # U+0AAE
+            'ય': '⠽',  # U+0AAF
+            'ર': '⠗',  # U+0AB0
+            'લ': '⠇',  # U+0AB2
+            'ળ': '⠸',  # U+0AB3
+            'વ': '⠧',  # U+0AB5
+            'શ': '⠩',  # U+0AB6
+            'ષ': '⠯',  # U+0AB7
+            'સ': '⠎',  # U+0AB8
+            'હ': '⠓',  # U+0AB9
+            '઼': '',  # U+0ABC
+            'ઽ': '⠂',  # U+0ABD
+            'ા': '⠜',  # U+0ABE
+            'િ': '⠊',  # U+0ABF
+            'ી': '⠔',  # U+0AC0
+            'ુ': '⠥',  # U+0AC1
+            'ૂ': '⠳',  # U+0AC2
+            'ૃ': '⠐⠗',  # U+0AC3
+            'ૄ': '⠠⠗',  # U+0AC4
+            'ૅ': '⠢',  # U+0AC5
+            'ે': '⠑',  # U+0AC7
+            'ૈ': '⠌',  # U+0AC8
+            'ૉ': '⠭',  # U+0AC9
+            'ો': '⠕',  # U+0ACB
+            'ૌ': '⠪',  # U+0ACC
+            '્': '⠈',  # U+0ACD
+            'ૠ': '⠠⠗',  # U+0AE0
+            '‐': '⠤',  # U+2010
+            '–': '⠤⠤',  # U+2013
+            '—': '⠤⠤⠤⠤',  # U+2014
+        },
+        'indic_to_bb_composite': {
+            'ક્ષ': '⠟',  # U+0A95 U+0ACD U+0AB7
+            'જ્ઞ': '⠱',  # U+0A9C U+0ACD U+0A9E
+        },
+    },
+    'bn': {
+        'all_consonants': frozenset([
+            'ক',  # U+0995
+            'ক্ষ',  # U+0995 U+09CD U+09B7
+            'খ',  # U+0996
+            'গ',  # U+0997
+            'ঘ',  # U+0998
+            'ঙ',  # U+0999
+            'চ',  # U+099A
+            'ছ',  # U+099B
+            'জ',  # U+099C
+            'জ্ঞ',  # U+099C U+09CD U+099E
+            'ঝ',  # U+099D
+            'ঞ',  # U+099E
+            'ট',  # U+099F
+            'ঠ',  # U+09A0
+            'ড',  # U+09A1
+            'ড়',  # U+09A1 U+09BC
+            'ঢ',  # U+09A2
+            'ঢ়',  # U+09A2 U+09BC
+            'ণ',  # U+09A3
+            'ত',  # U+09A4
+            'থ',  # U+09A5
+            'দ',  # U+09A6
+            'ধ',  # U+09A7
+            'ন',  # U+09A8
+            'প',  # U+09AA
+            'ফ',  # U+09AB
+            'ব',  # U+09AC
+            'ভ',  # U+09AD
+            'ম',  # U+09AE
+            'য',  # U+09AF
+            'য়',  # U+09AF U+09BC
+            'র',  # U+09B0
+            'ল',  # U+09B2
+            'শ',  # U+09B6
+            'ষ',  # U+09B7
+            'স',  # U+09B8
+            'হ',  # U+09B9
+            'ড়',  # U+09DC
+            'ঢ়',  # U+09DD
+            'য়',  # U+09DF
+        ]),
+        'all_consonants_and_vowels': frozenset([
+            'অ',  # U+0985
+            'আ',  # U+0986
+            'ই',  # U+0987
+            'ঈ',  # U+0988
+            'উ',  # U+0989
+            'ঊ',  # U+098A
+            'ঋ',  # U+098B
+            'ঌ',  # U+098C
+            'এ',  # U+098F
+            'ঐ',  # U+0990
+            'ও',  # U+0993
+            'ঔ',  # U+0994
+            'ক',  # U+0995
+            'ক্ষ',  # U+0995 U+09CD U+09B7
+            'খ',  # U+0996
+            'গ',  # U+0997
+            'ঘ',  # U+0998
+            'ঙ',  # U+0999
+            'চ',  # U+099A
+            'ছ',  # U+099B
+            'জ',  # U+099C
+            'জ্ঞ',  # U+099C U+09CD U+099E
+            'ঝ',  # U+099D
+            'ঞ',  # U+099E
+            'ট',  # U+099F
+            'ঠ',  # U+09A0
+            'ড',  # U+09A1
+            'ড়',  # U+09A1 U+09BC
+            'ঢ',  # U+09A2
+            'ঢ়',  # U+09A2 U+09BC
+            'ণ',  # U+09A3
+            'ত',  # U+09A4
+            'থ',  # U+09A5
+            'দ',  # U+09A6
+            'ধ',  # U+09A7
+            'ন',  # U+09A8
+            'প',  # U+09AA
+            'ফ',  # U+09AB
+            'ব',  # U+09AC
+            'ভ',  # U+09AD
+            'ম',  # U+09AE
+            'য',  # U+09AF
+            'য়',  # U+09AF U+09BC
+            'র',  # U+09B0
+            'ল',  # U+09B2
+            'শ',  # U+09B6
+            'ষ',  # U+09B7
+            'স',  # U+09B8
+            'হ',  # U+09B9
+            'া',  # U+09BE
+            'ি',  # U+09BF
+            'ী',  # U+09C0
+            'ু',  # U+09C1
+            'ূ',  # U+09C2
+            'ৃ',  # U+09C3
+            'ে',  # U+09C7
+            'ৈ',  # U+09C8
+            'ো',  # U+09CB
+            'ৌ',  # U+09CC
+            'ড়',  # U+09DC
+            'ঢ়',  # U+09DD
+            'য়',  # U+09DF
+            'ৢ',  # U+09E2
+        ]),
+        'vowel_chars': frozenset([
+            'আ',  # U+0986
+            'ই',  # U+0987
+            'ঈ',  # U+0988
+            'উ',  # U+0989
+            'ঊ',  # U+098A
+            'ঋ',  # U+098B
+            'ঌ',  # U+098C
+            'এ',  # U+098F
+            'ঐ',  # U+0990
+            'ও',  # U+0993
+            'ঔ',  # U+0994
+        ]),
+        'indic_to_bb': {
+            '-': '⠤',  # U+002D
+            'ঁ': '⠄',  # U+0981
+            'ং': '⠰',  # U+0982
+            'ঃ': '⠠',  # U+0983
+            'অ': '⠁',  # U+0985
+            'আ': '⠜',  # U+0986
+            'ই': '⠊',  # U+0987
+            'ঈ': '⠔',  # U+0988
+            'উ': '⠥',  # U+0989
+            'ঊ': '⠳',  # U+098A
+            'ঋ': '⠐⠗',  # U+098B
+            'ঌ': '⠐⠇',  # U+098C
+            'এ': '⠑',  # U+098F
+            'ঐ': '⠌',  # U+0990
+            'ও': '⠕',  # U+0993
+            'ঔ': '⠪',  # U+0994
+            'ক': '⠅',  # U+0995
+            'খ': '⠨',  # U+0996
+            'গ': '⠛',  # U+0997
+            'ঘ': '⠣',  # U+0998
+            'ঙ': '⠬',  # U+0999
+            'চ': '⠉',  # U+099A
+            'ছ': '⠡',  # U+099B
+            'জ': '⠚',  # U+099C
+            'ঝ': '⠴',  # U+099D
+            'ঞ': '⠒',  # U+099E
+            'ট': '⠾',  # U+099F
+            'ঠ': '⠺',  # U+09A0
+            'ড': '⠫',  # U+09A1
+            'ঢ': '⠿',  # U+09A2
+            'ণ': '⠼',  # U+09A3
+            'ত': '⠞',  # U+09A4
+            'থ': '⠹',  # U+09A5
+            'দ': '⠙',  # U+09A6
+            'ধ': '⠮',  # U+09A7
+            'ন': '⠝',  # U+09A8
+            'প': '⠏',  # U+09AA
+            'ফ': '⠖',  # U+09AB
+            'ব': '⠃',  # U+09AC
+            'ভ': '⠘',  # U+09AD
+            'ম': '⠍',  # U+09AE
+            'য': '⠽',  # U+09AF
+            'র': '⠗',  # U+09B0
+            'ল': '⠇',  # U+09B2
+            'শ': '⠩',  # U+09B6
+            'ষ': '⠯',  # U+09B7
+            'স': '⠎',  # U+09B8
+            'হ': '⠓',  # U+09B9
+            '়': '',  # U+09BC
+            'ঽ': '⠂',  # U+09BD
+            'া': '⠜',  # U+09BE
+            'ি': '⠊',  # U+09BF
+            'ী': '⠔',  # U+09C0
+            'ু': '⠥',  # U+09C1
+            'ূ': '⠳',  # U+09C2
+            'ৃ': '⠐⠗',  # U+09C3
+            'ে': '⠑',  # U+09C7
+            'ৈ': '⠌',  # U+09C8
+            'ো': '⠕',  # U+09CB
+            'ৌ': '⠪',  # U+09CC
+            '্': '⠈',  # U+09CD
+            'ড়': '⠻',  # U+09DC
+            'ঢ়': '⠐⠻',  # U+09DD
+            'য়': '⠢',  # U+09DF
+            'ৢ': '⠐⠇',  # U+09E2
+            '‐': '⠤',  # U+2010
+            '–': '⠤⠤',  # U+2013
+            '—': '⠤⠤⠤⠤',  # U+2014
+        },
+        'indic_to_bb_composite': {
+            'ক্ষ': '⠟',  # U+0995 U+09CD U+09B7
+            'জ্ঞ': '⠱',  # U+099C U+09CD U+099E
+            'ড়': '⠻',  # U+09A1 U+09BC
+            'ঢ়': '⠐⠻',  # U+09A2 U+09BC
+            'য়': '⠢',  # U+09AF U+09BC
+        },
+    },
+    'te': {
+        'all_consonants': frozenset([
+            'క',  # U+0C15
+            'క్ష',  # U+0C15 U+0C4D U+0C37
+            'ఖ',  # U+0C16
+            'గ',  # U+0C17
+            'ఘ',  # U+0C18
+            'ఙ',  # U+0C19
+            'చ',  # U+0C1A
+            'ఛ',  # U+0C1B
+            'జ',  # U+0C1C
+            'ఝ',  # U+0C1D
+            'ఞ',  # U+0C1E
+            'ట',  # U+0C1F
+            'ఠ',  # U+0C20
+            'డ',  # U+0C21
+            'ఢ',  # U+0C22
+            'ణ',  # U+0C23
+            'త',  # U+0C24
+            'థ',  # U+0C25
+            'ద',  # U+0C26
+            'ధ',  # U+0C27
+            'న',  # U+0C28
+            'ప',  # U+0C2A
+            'ఫ',  # U+0C2B
+            'బ',  # U+0C2C
+            'భ',  # U+0C2D
+            'మ',  # U+0C2E
+            'య',  # U+0C2F
+            'ర',  # U+0C30
+            'ఱ',  # U+0C31
+            'ల',  # U+0C32
+            'ళ',  # U+0C33
+            'వ',  # U+0C35
+            'శ',  # U+0C36
+            'ష',  # U+0C37
+            'స',  # U+0C38
+            'హ',  # U+0C39
+        ]),
+        'all_consonants_and_vowels': frozenset([
+            'అ',  # U+0C05
+            'ఆ',  # U+0C06
+            'ఇ',  # U+0C07
+            'ఈ',  # U+0C08
+            'ఉ',  # U+0C09
+            'ఊ',  # U+0C0A
+            'ఋ',  # U+0C0B
+            'ఌ',  # U+0C0C
+            'ఎ',  # U+0C0E
+            'ఏ',  # U+0C0F
+            'ఐ',  # U+0C10
+            'ఒ',  # U+0C12
+            'ఓ',  # U+0C13
+            'ఔ',  # U+0C14
+            'క',  # U+0C15
+            'క్ష',  # U+0C15 U+0C4D U+0C37
+            'ఖ',  # U+0C16
+            'గ',  # U+0C17
+            'ఘ',  # U+0C18
+            'ఙ',  # U+0C19
+            'చ',  # U+0C1A
+            'ఛ',  # U+0C1B
+            'జ',  # U+0C1C
+            'ఝ',  # U+0C1D
+            'ఞ',  # U+0C1E
+            'ట',  # U+0C1F
+            'ఠ',  # U+0C20
+            'డ',  # U+0C21
+            'ఢ',  # U+0C22
+            'ణ',  # U+0C23
+            'త',  # U+0C24
+            'థ',  # U+0C25
+            'ద',  # U+0C26
+            'ధ',  # U+0C27
+            'న',  # U+0C28
+            'ప',  # U+0C2A
+            'ఫ',  # U+0C2B
+            'బ',  # U+0C2C
+            'భ',  # U+0C2D
+            'మ',  # U+0C2E
+            'య',  # U+0C2F
+            'ర',  # U+0C30
+            'ఱ',  # U+0C31
+            'ల',  # U+0C32
+            'ళ',  # U+0C33
+            'వ',  # U+0C35
+            'శ',  # U+0C36
+            'ష',  # U+0C37
+            'స',  # U+0C38
+            'హ',  # U+0C39
+            'ా',  # U+0C3E
+            'ి',  # U+0C3F
+            'ీ',  # U+0C40
+            'ు',  # U+0C41
+            'ూ',  # U+0C42
+            'ృ',  # U+0C43
+            'ౄ',  # U+0C44
+            'ె',  # U+0C46
+            'ే',  # U+0C47
+            'ై',  # U+0C48
+            'ొ',  # U+0C4A
+            'ో',  # U+0C4B
+            'ౌ',  # U+0C4C
+            'ౠ',  # U+0C60
+            'ౡ',  # U+0C61
+            'ౢ',  # U+0C62
+            'ౣ',  # U+0C63
+        ]),
+        'vowel_chars': frozenset([
+            'ఆ',  # U+0C06
+            'ఇ',  # U+0C07
+            'ఈ',  # U+0C08
+            'ఉ',  # U+0C09
+            'ఊ',  # U+0C0A
+            'ఋ',  # U+0C0B
+            'ఌ',  # U+0C0C
+            'ఎ',  # U+0C0E
+            'ఏ',  # U+0C0F
+            'ఐ',  # U+0C10
+            'ఒ',  # U+0C12
+            'ఓ',  # U+0C13
+            'ఔ',  # U+0C14
+            'ౠ',  # U+0C60
+            'ౡ',  # U+0C61
+        ]),
+        'indic_to_bb': {
+            '-': '⠤',  # U+002D
+            'ఁ': '⠄',  # U+0C01
+            'ం': '⠰',  # U+0C02
+            'ః': '⠠',  # U+0C03
+            'అ': '⠁',  # U+0C05
+            'ఆ': '⠜',  # U+0C06
+            'ఇ': '⠊',  # U+0C07
+            'ఈ': '⠔',  # U+0C08
+            'ఉ': '⠥',  # U+0C09
+            'ఊ': '⠳',  # U+0C0A
+            'ఋ': '⠐⠗',  # U+0C0B
+            'ఌ': '⠐⠇',  # U+0C0C
+            'ఎ': '⠢',  # U+0C0E
+            'ఏ': '⠑',  # U+0C0F
+            'ఐ': '⠌',  # U+0C10
+            'ఒ': '⠭',  # U+0C12
+            'ఓ': '⠕',  # U+0C13
+            'ఔ': '⠪',  # U+0C14
+            'క': '⠅',  # U+0C15
+            'ఖ': '⠨',  # U+0C16
+            'గ': '⠛',  # U+0C17
+            'ఘ': '⠣',  # U+0C18
+            'ఙ': '⠬',  # U+0C19
+            'చ': '⠉',  # U+0C1A
+            'ఛ': '⠡',  # U+0C1B
+            'జ': '⠚',  # U+0C1C
+            'ఝ': '⠴',  # U+0C1D
+            'ఞ': '⠒',  # U+0C1E
+            'ట': '⠾',  # U+0C1F
+            'ఠ': '⠺',  # U+0C20
+            'డ': '⠫',  # U+0C21
+            'ఢ': '⠿',  # U+0C22
+            'ణ': '⠼',  # U+0C23
+            'త': '⠞',  # U+0C24
+            'థ': '⠹',  # U+0C25
+            'ద': '⠙',  # U+0C26
+            'ధ': '⠮',  # U+0C27
+            'న': '⠝',  # U+0C28
+            'ప': '⠏',  # U+0C2A
+            'ఫ': '⠖',  # U+0C2B
+            'బ': '⠃',  # U+0C2C
+            'భ': '⠘',  # U+0C2D
+            'మ': '⠍',  # U+0C2E
+            'య': '⠽',  # U+0C2F
+            'ర': '⠗',  # U+0C30
+            'ఱ': '⠻',  # U+0C31
+            'ల': '⠇',  # U+0C32
+            'ళ': '⠸',  # U+0C33
+            'వ': '⠧',  # U+0C35
+            'శ': '⠩',  # U+0C36
+            'ష': '⠯',  # U+0C37
+            'స': '⠎',  # U+0C38
+            'హ': '⠓',  # U+0C39
+            'ఽ': '',  # U+0C3D
+            'ా': '⠜',  # U+0C3E
+            'ి': '⠊',  # U+0C3F
+            'ీ': '⠔',  # U+0C40
+            'ు': '⠥',  # U+0C41
+            'ూ': '⠳',  # U+0C42
+            'ృ': '⠐⠗',  # U+0C43
+            'ౄ': '⠠⠗',  # U+0C44
+            'ె': '⠢',  # U+0C46
+            'ే': '⠑',  # U+0C47
+            'ై': '⠌',  # U+0C48
+            'ొ': '⠭',  # U+0C4A
+            'ో': '⠕',  # U+0C4B
+            'ౌ': '⠪',  # U+0C4C
+            '్': '⠈',  # U+0C4D
+            'ౠ': '⠠⠗',  # U+0C60
+            'ౡ': '⠠⠇',  # U+0C61
+            'ౢ': '⠐⠇',  # U+0C62
+            'ౣ': '⠠⠇',  # U+0C63
+            '‐': '⠤',  # U+2010
+            '–': '⠤⠤',  # U+2013
+            '—': '⠤⠤⠤⠤',  # U+2014
+        },
+        'indic_to_bb_composite': {
+            'క్ష': '⠟',  # U+0C15 U+0C4D U+0C37
+        },
+    },
+    'ta': {
+        'all_consonants': frozenset([
+            'க',  # U+0B95
+            'க்ஷ',  # U+0B95 U+0BCD U+0BB7
+            'ங',  # U+0B99
+            'ச',  # U+0B9A
+            'ஜ',  # U+0B9C
+            'ஞ',  # U+0B9E
+            'ட',  # U+0B9F
+            'ண',  # U+0BA3
+            'த',  # U+0BA4
+            'ந',  # U+0BA8
+            'ப',  # U+0BAA
+            'ம',  # U+0BAE
+            'ய',  # U+0BAF
+            'ர',  # U+0BB0
+            'ற',  # U+0BB1
+            'ல',  # U+0BB2
+            'ள',  # U+0BB3
+            'ழ',  # U+0BB4
+            'வ',  # U+0BB5
+            'ஷ',  # U+0BB7
+            'ஸ',  # U+0BB8
+            'ஹ',  # U+0BB9
+        ]),
+        'all_consonants_and_vowels': frozenset([
+            'அ',  # U+0B85
+            'ஆ',  # U+0B86
+            'இ',  # U+0B87
+            'ஈ',  # U+0B88
+            'உ',  # U+0B89
+            'ஊ',  # U+0B8A
+            'எ',  # U+0B8E
+            'ஏ',  # U+0B8F
+            'ஐ',  # U+0B90
+            'ஒ',  # U+0B92
+            'ஓ',  # U+0B93
+            'ஔ',  # U+0B94
+            'க',  # U+0B95
+            'க்ஷ',  # U+0B95 U+0BCD U+0BB7
+            'ங',  # U+0B99
+            'ச',  # U+0B9A
+            'ஜ',  # U+0B9C
+            'ஞ',  # U+0B9E
+            'ட',  # U+0B9F
+            'ண',  # U+0BA3
+            'த',  # U+0BA4
+            'ந',  # U+0BA8
+            'ப',  # U+0BAA
+            'ம',  # U+0BAE
+            'ய',  # U+0BAF
+            'ர',  # U+0BB0
+            'ற',  # U+0BB1
+            'ல',  # U+0BB2
+            'ள',  # U+0BB3
+            'ழ',  # U+0BB4
+            'வ',  # U+0BB5
+            'ஷ',  # U+0BB7
+            'ஸ',  # U+0BB8
+            'ஹ',  # U+0BB9
+            'ா',  # U+0BBE
+            'ி',  # U+0BBF
+            'ீ',  # U+0BC0
+            'ு',  # U+0BC1
+            'ூ',  # U+0BC2
+            'ெ',  # U+0BC6
+            'ே',  # U+0BC7
+            'ை',  # U+0BC8
+            'ொ',  # U+0BCA
+            'ோ',  # U+0BCB
+            'ௌ',  # U+0BCC
+        ]),
+        'vowel_chars': frozenset([
+            'ஆ',  # U+0B86
+            'இ',  # U+0B87
+            'ஈ',  # U+0B88
+            'உ',  # U+0B89
+            'ஊ',  # U+0B8A
+            'எ',  # U+0B8E
+            'ஏ',  # U+0B8F
+            'ஐ',  # U+0B90
+            'ஒ',  # U+0B92
+            'ஓ',  # U+0B93
+            'ஔ',  # U+0B94
+        ]),
+        'indic_to_bb': {
+            '-': '⠤',  # U+002D
+            'ஃ': '⠠',  # U+0B83
+            'அ': '⠁',  # U+0B85
+            'ஆ': '⠜',  # U+0B86
+            'இ': '⠊',  # U+0B87
+            'ஈ': '⠔',  # U+0B88
+            'உ': '⠥',  # U+0B89
+            'ஊ': '⠳',  # U+0B8A
+            'எ': '⠢',  # U+0B8E
+            'ஏ': '⠑',  # U+0B8F
+            'ஐ': '⠌',  # U+0B90
+            'ஒ': '⠭',  # U+0B92
+            'ஓ': '⠕',  # U+0B93
+            'ஔ': '⠪',  # U+0B94
+            'க': '⠅',  # U+0B95
+            'ங': '⠬',  # U+0B99
+            'ச': '⠉',  # U+0B9A
+            'ஜ': '⠚',  # U+0B9C
+            'ஞ': '⠒',  # U+0B9E
+            'ட': '⠾',  # U+0B9F
+            'ண': '⠼',  # U+0BA3
+            'த': '⠞',  # U+0BA4
+            'ந': '⠝',  # U+0BA8
+            'ப': '⠏',  # U+0BAA
+            'ம': '⠍',  # U+0BAE
+            'ய': '⠽',  # U+0BAF
+            'ர': '⠗',  # U+0BB0
+            'ற': '⠻',  # U+0BB1
+            'ல': '⠇',  # U+0BB2
+            'ள': '⠸',  # U+0BB3
+            'ழ': '⠷',  # U+0BB4
+            'வ': '⠧',  # U+0BB5
+            'ஷ': '⠯',  # U+0BB7
+            'ஸ': '⠎',  # U+0BB8
+            'ஹ': '⠓',  # U+0BB9
+            'ா': '⠜',  # U+0BBE
+            'ி': '⠊',  # U+0BBF
+            'ீ': '⠔',  # U+0BC0
+            'ு': '⠥',  # U+0BC1
+            'ூ': '⠳',  # U+0BC2
+            'ெ': '⠢',  # U+0BC6
+            'ே': '⠑',  # U+0BC7
+            'ை': '⠌',  # U+0BC8
+            'ொ': '⠭',  # U+0BCA
+            'ோ': '⠕',  # U+0BCB
+            'ௌ': '⠪',  # U+0BCC
+            '்': '⠈',  # U+0BCD
+            'ௗ': '⠰',  # U+0BD7
+            '‐': '⠤',  # U+2010
+            '–': '⠤⠤',  # U+2013
+            '—': '⠤⠤⠤⠤',  # U+2014
+        },
+        'indic_to_bb_composite': {
+            'க்ஷ': '⠟',  # U+0B95 U+0BCD U+0BB7
+        },
+    },
+}
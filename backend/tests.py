@@ -62,6 +62,61 @@ class TestCommonGlyphs(unittest.TestCase):
         self.assertEqual(convert_common_glyphs_to_braille (COMMON_INPUT),
                          COMMON_OUTPUT)
 
+class TestGeneratedTables(unittest.TestCase):
+    def test_up_to_date(self):
+        from converters import generated_tables, script_mappings
+        from converters import _perform_common_pre_processing
+        from converters import _perform_mapping_pre_processing
+        from converters import tables_up_to_date
+        if generated_tables is None:
+            self.skipTest("backend/tables.py has not been generated")
+        # Run python3 -m backend.generate_tables if this fails
+        self.assertTrue(tables_up_to_date)
+        self.assertEqual((generated_tables.cm_to_bb_punctuation,
+                          generated_tables.cm_to_bb_numbers,
+                          generated_tables.cm_to_bb_math_punctuation),
+                         _perform_common_pre_processing())
+        names = ("all_consonants", "all_consonants_and_vowels",
+                 "vowel_chars", "indic_to_bb", "indic_to_bb_composite")
+        for (script, mapping) in script_mappings.items():
+            tables = _perform_mapping_pre_processing(*mapping[2:])
+            for (name, table) in zip(names, tables):
+                self.assertEqual(generated_tables.scripts[script][name], table)
+
+    def test_fallback(self):
+        import converters
+        from converters import script_mappings, dv_converter
+        from converters import _build_script_converter
+        # A script that is not in the generated tables
+        plan = _build_script_converter("dv2", *script_mappings["dv"])
+        self.assertEqual(plan.convert(DV_SHIKSHAK_INPUT),
+                         dv_converter.convert(DV_SHIKSHAK_INPUT))
+        # Tables generated from other mappings
+        (up_to_date, converters.tables_up_to_date) = (
+            converters.tables_up_to_date, False)
+        try:
+            plan = _build_script_converter("dv", *script_mappings["dv"])
+        finally:
+            converters.tables_up_to_date = up_to_date
+        self.assertEqual(plan.indic_to_bb, dv_converter.indic_to_bb)
+        self.assertEqual(plan.convert(DV_SHIKSHAK_INPUT),
+                         dv_converter.convert(DV_SHIKSHAK_INPUT))
+
+class TestCompositeTrie(unittest.TestCase):
+    def test_longest_match(self):
+        from converters import CompositeTrie
+        trie = CompositeTrie({"ab": "1", "abc": "2", "bc": "3", "abd": "4"})
+        self.assertEqual(trie.replace("abcbcabxab"), "231x1")
+        self.assertEqual(trie.replace("abdab"), "41")
+        self.assertEqual(trie.match("xabc", 1), ("2", 4))
+        self.assertEqual(trie.match("xab", 0), (None, 0))
+
+    def test_devanagari_akhand(self):
+        from converters import dv_converter
+        self.assertEqual(dv_converter.composites.replace(
+                             dv_converter.canonicalise("क्षक़क्ज्ञ")),
+                         "⠟\u0958क्⠱")
+
 class TestDevanagari(unittest.TestCase):
     def test_explicit_schwa(self):
         from converters import dv_schwa, all_dv_consonants, dv_vowel_chars
@@ -97,6 +152,46 @@ class TestDevanagari(unittest.TestCase):
         self.assertEqual(convert_devanagari_to_braille(COMPOSITE_INPUT)[0],
                          COMPOSITE_OUTPUT)
 
+    def test_nukta_forms(self):
+        from converters import dv_converter
+        self.assertEqual(dv_converter.canonicalise("क़ ड़ि ऩ क़्ष क्ष़ ़"),
+                         "\u0958 \u095Cि \u0929 \u0958्ष क्ष़ ़")
+        self.assertIs(dv_converter.canonicalise(DV_ACHARYA_INPUT),
+                      DV_ACHARYA_INPUT)
+        for text in ("क़ा", "ज़्ञ", "फ़्रांस", "रफ़्तार"):
+            self.assertEqual(dv_converter.convert(text),
+                             dv_converter.convert(
+                                 dv_converter.canonicalise(text)))
+
+    def test_converter_plan(self):
+        from converters import dv_schwa, dv_virama, all_dv_consonants
+        from converters import dv_vowel_chars, dv_to_bb, dv_to_bb_composite
+        from converters import dv_converter, convert_indic_to_braille
+        self.assertEqual(dv_converter.convert(DV_SHIKSHAK_INPUT),
+                         convert_indic_to_braille(DV_SHIKSHAK_INPUT, dv_schwa,
+                                                  dv_virama, all_dv_consonants,
+                                                  dv_vowel_chars, dv_to_bb,
+                                                  dv_to_bb_composite))
+
+    def test_converter_plan_reused(self):
+        from converters import dv_schwa, dv_virama, all_dv_consonants
+        from converters import dv_vowel_chars, dv_to_bb, dv_to_bb_composite
+        from converters import dv_converter, _plan_for
+        arguments = (dv_schwa, dv_virama, all_dv_consonants, dv_vowel_chars,
+                     dv_to_bb, dv_to_bb_composite)
+        self.assertIs(_plan_for(*arguments), dv_converter)
+        # Tables of one's own get a plan of their own, built once
+        arguments = arguments[:4] + (dict(dv_to_bb), dv_to_bb_composite)
+        plan = _plan_for(*arguments)
+        self.assertIsNot(plan, dv_converter)
+        self.assertIs(_plan_for(*arguments), plan)
+        self.assertEqual(plan.convert(DV_SHIKSHAK_INPUT),
+                         dv_converter.convert(DV_SHIKSHAK_INPUT))
+        # Changing the tables in place is not missed
+        arguments[4]["क"] = "⠿"
+        self.assertEqual(_plan_for(*arguments).convert("क")[0], "⠿")
+        self.assertEqual(plan.convert("क")[0], "⠅")
+
 class TestGujarati(unittest.TestCase):
     # TODO: Use Gujarati here and implement everything else
     def test_virama_reversal(self):
@@ -135,6 +230,11 @@ class TestBengali(unittest.TestCase):
         self.assertEqual(convert_bengali_to_braille(COMPOSITE_INPUT)[0],
                          COMPOSITE_OUTPUT)
 
+    def test_ba_va(self):
+        from converters import convert_bengali_to_braille
+        # BA and VA are the same letter; the first mapping (BA) is used
+        self.assertEqual(convert_bengali_to_braille("ব")[0], "⠃")
+
 class TestTelugu(unittest.TestCase):
     # TODO: Use Telugu here and implement everything else
     def test_virama_reversal(self):
@@ -163,52 +263,529 @@ class TestTamil(unittest.TestCase):
         self.assertEqual(convert_tamil_to_braille ("ADD TEST STRING HERE")[0],
                          "ADD TEST STRING HERE")
 
+class TestTransducer(unittest.TestCase):
+    def test_devanagari(self):
+        from converters import dv_converter
+        self.assertEqual(dv_converter.transduce(DV_ACHARYA_INPUT)[0],
+                         DV_ACHARYA_OUTPUT)
+        self.assertEqual(dv_converter.transduce(DV_SHIKSHAK_INPUT)[0],
+                         DV_SHIKSHAK_OUTPUT)
+        self.assertEqual(dv_converter.transduce("ढ़िमफ़ोऩुड़")[0],
+                         "⠐⠻⠊⠍⠖⠕⠝⠥⠻")
+
+    def test_bengali(self):
+        from converters import bn_converter
+        self.assertEqual(bn_converter.transduce("মুখোপাধ্যায়")[0],
+                         "⠍⠥⠨⠕⠏⠜⠈⠮⠽⠜⠢")
+
+    def test_common_glyphs(self):
+        from converters import dv_converter, convert_common_glyphs_to_braille
+        COMMON_INPUT = "333 1,2,2 1,000,000 1.0.4 .8 .1.1 7.6 8. 999, ,555" \
+                       " ‐ - – — ... … , ; : । ॥ ! ? * ....5 5..5 1...2"
+        self.assertEqual(dv_converter.transduce(COMMON_INPUT)[0],
+                         convert_common_glyphs_to_braille(COMMON_INPUT))
+
+    def test_virama_reversal(self):
+        from converters import dv_converter
+        for text in ("क्", "क््", "क्््", "क़्", "\n्", "5्", "क ्"):
+            self.assertEqual(dv_converter.transduce(text),
+                             dv_converter.convert(text))
+
+    def test_warnings(self):
+        from converters import dv_converter, ConversionWarning
+        from converters import BB_WARN_DUMB_QUOTES, BB_WARN_MATH_OPS
+        text = 'कहा "२+२=४" ठीक?'
+        (braille, warnings) = dv_converter.convert(text)
+        self.assertEqual(warnings,
+                         [ConversionWarning(BB_WARN_DUMB_QUOTES,
+                                            braille.index('"'), 2),
+                          ConversionWarning(BB_WARN_MATH_OPS,
+                                            braille.index("+"), 2)])
+        self.assertEqual(dv_converter.transduce(text), (braille, warnings))
+
+    def test_offsets(self):
+        from converters import dv_converter, convert_indic_to_braille
+        from converters import dv_schwa, dv_virama, all_dv_consonants
+        from converters import dv_vowel_chars, dv_to_bb, dv_to_bb_composite
+        text = "क्ष स्त्री 12.5 ...फ़ि सईयाँ"
+        (braille, warnings, offsets) = dv_converter.convert(text,
+                                                            offsets=True)
+        self.assertEqual((braille, warnings), dv_converter.convert(text))
+        self.assertEqual(offsets.typecode, "I")
+        self.assertEqual(len(offsets), len(text) + 1)
+        self.assertEqual(
+            [braille[offsets[i]:offsets[i+1]] for i in range(len(text))],
+            ["", "", "⠟", " ", "⠈⠎", "", "⠈⠞", "", "⠗", "⠔", " ", "", "",
+             "", "⠼⠁⠃⠨⠑", " ", "", "", "⠠⠠⠠", "", "⠖", "⠊", " ", "⠎",
+             "⠁⠔", "⠽", "⠜", "⠄"])
+        for (index, char) in enumerate(text):
+            if char == " ":
+                self.assertEqual(offsets[index],
+                                 len(dv_converter.convert(text[:index])[0]))
+        self.assertEqual(convert_indic_to_braille(text, dv_schwa, dv_virama,
+                                                  all_dv_consonants,
+                                                  dv_vowel_chars, dv_to_bb,
+                                                  dv_to_bb_composite,
+                                                  offsets=True),
+                         (braille, warnings, offsets))
+
+class TestCharClasses(unittest.TestCase):
+    def test_classes(self):
+        from converters import char_class_of, CLASS_CONSONANT, CLASS_VIRAMA
+        from converters import CLASS_VOWEL_CHAR, CLASS_VOWEL_SIGN
+        from converters import CLASS_COMPOSITE_START, CLASS_DIGIT
+        from converters import CLASS_NUMBER_PUNCTUATION, CLASS_PUNCTUATION
+        from converters import CLASS_DUMB_QUOTE, CLASS_MATH_SYMBOL
+        self.assertEqual(char_class_of("क"),
+                         CLASS_CONSONANT | CLASS_COMPOSITE_START)
+        self.assertEqual(char_class_of("ব"), CLASS_CONSONANT)
+        self.assertEqual(char_class_of("आ"), CLASS_VOWEL_CHAR)
+        self.assertEqual(char_class_of("ि"), CLASS_VOWEL_SIGN)
+        self.assertTrue(char_class_of("்") & CLASS_VIRAMA)
+        self.assertEqual(char_class_of("३"), CLASS_DIGIT)
+        self.assertEqual(char_class_of("."), CLASS_NUMBER_PUNCTUATION)
+        self.assertEqual(char_class_of(","),
+                         CLASS_NUMBER_PUNCTUATION | CLASS_PUNCTUATION)
+        self.assertEqual(char_class_of('"'), CLASS_DUMB_QUOTE)
+        self.assertEqual(char_class_of("÷"), CLASS_MATH_SYMBOL)
+        for char in ("a", " ", "\n", "⠁", "\U0001F600"):
+            self.assertEqual(char_class_of(char), 0)
+
+    def test_converters(self):
+        from converters import char_class_of, script_converters
+        from converters import CLASS_VOWEL_CHAR, CLASS_VIRAMA
+        for converter in script_converters.values():
+            for char in converter.vowel_chars:
+                self.assertTrue(char_class_of(char) & CLASS_VOWEL_CHAR)
+            for char in converter.virama_starters - {converter.virama}:
+                self.assertTrue(char_class_of(char) & CLASS_VIRAMA)
+
+class TestStreaming(unittest.TestCase):
+    def test_chunks(self):
+        from converters import iter_convert, convert_devanagari_to_braille
+        text = DV_SHIKSHAK_INPUT + ' "क्ष" १,००० ...् ' + DV_ACHARYA_INPUT
+        (braille, warnings) = convert_devanagari_to_braille(text)
+        for size in (1, 2, 3, 5, 64):
+            chunks = [text[i:i+size] for i in range(0, len(text), size)]
+            stream_warnings = []
+            self.assertEqual(''.join(iter_convert(chunks, "dv",
+                                                  stream_warnings)),
+                             braille)
+            self.assertEqual(stream_warnings, warnings)
+
+    def test_file(self):
+        import io
+        from converters import iter_convert, convert_any_indic_to_braille
+        source = io.StringIO("12 " + DV_ACHARYA_INPUT)
+        self.assertEqual(''.join(iter_convert(source, block_size=4)),
+                         convert_any_indic_to_braille("12 " +
+                                                      DV_ACHARYA_INPUT)[0])
+
+    def test_script_errors(self):
+        from converters import iter_convert, ScriptConflict
+        from converters import BB_ERR_UNKNOWN_SCRIPT
+        from converters import convert_any_indic_to_braille
+        warnings = []
+        self.assertEqual(list(iter_convert(["Non-indic", " text"],
+                                           warnings=warnings)), [])
+        self.assertEqual([warning.kind for warning in warnings],
+                         [BB_ERR_UNKNOWN_SCRIPT])
+        with self.assertRaises(ScriptConflict):
+            list(iter_convert(["है ", "ল"]))
+        chunks = ["Non-indic text " * 100] * 10 + ["है"]
+        with self.assertRaises(ValueError):
+            list(iter_convert(chunks, hold_limit=4096))
+        self.assertEqual(''.join(iter_convert(chunks, "dv", hold_limit=4096)),
+                         convert_any_indic_to_braille(''.join(chunks))[0])
+
+class TestBatch(unittest.TestCase):
+    TEXTS = ["देवनागरी", "বাংলা\nদুই", "", "Non-indic text", "है ল",
+             DV_SHIKSHAK_INPUT, 'तमिल "தமிழ்"', "12 + 3", "ગુજરાતી 1,000",
+             "తెలుగు…", "देव\n\nनागरी"]
+
+    def test_convert_many(self):
+        from converters import convert_many, convert_any_indic_to_braille
+        expected = [convert_any_indic_to_braille(text) for text in self.TEXTS]
+        for group_size in (0, 1, 20, 4096):
+            self.assertEqual(convert_many(self.TEXTS, group_size=group_size),
+                             expected)
+
+    def test_convert_many_script(self):
+        from converters import convert_many, convert_devanagari_to_braille
+        texts = DV_ACHARYA_INPUT.split(" ") + ['"', "+"]
+        self.assertEqual(convert_many(texts, "dv"),
+                         [convert_devanagari_to_braille(text)
+                          for text in texts])
+
+    def test_convert_many_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from converters import convert_many
+        texts = self.TEXTS * 50
+        expected = convert_many(texts, group_size=20)
+        self.assertEqual(convert_many(texts, group_size=20, threads=4),
+                         expected)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(convert_many(texts, group_size=20,
+                                          executor=executor),
+                             expected)
+
+    def test_lazy_tables(self):
+        from converters import ScriptConverters, script_mappings
+        from converters import dv_converter, all_dv_consonants, dv_to_bb
+        plans = ScriptConverters(script_mappings)
+        self.assertEqual(plans.built, {})
+        self.assertEqual(plans["ta"].name, "ta")
+        self.assertEqual(list(plans.built), ["ta"])
+        self.assertIs(plans["ta"], plans["ta"])
+        self.assertEqual(list(plans), ["dv", "gu", "bn", "te", "ta"])
+        self.assertIs(all_dv_consonants, dv_converter.all_consonants)
+        self.assertIs(dv_to_bb, dv_converter.indic_to_bb)
+
+    def test_frozen_tables(self):
+        from converters import dv_converter, script_converters
+        with self.assertRaises(TypeError):
+            dv_converter.indic_to_bb["क"] = "⠿"
+        with self.assertRaises(TypeError):
+            script_converters["xx"] = dv_converter
+        with self.assertRaises(AttributeError):
+            dv_converter.vowel_chars.add("क")
+
+class TestWordCache(unittest.TestCase):
+    def test_convert(self):
+        from converters import WordCache, convert_any_indic_to_braille
+        from converters import script_converters
+        cache = WordCache()
+        for text in TestBatch.TEXTS + ["क ्ष", "क\n्ष", "क ़्ष", "…  ्"]:
+            self.assertEqual(cache.convert(text),
+                             convert_any_indic_to_braille(text))
+        # Tamil has no silent characters
+        self.assertEqual(script_converters["ta"].word_pattern.split(
+                             "க *x ]y"),
+                         ["", "க", " ", "*x", " ", "]y", ""])
+        for text in ["தமிழ் *x ]y", "க ்க", "க *்"]:
+            self.assertEqual(cache.convert(text),
+                             convert_any_indic_to_braille(text))
+
+    def test_eviction(self):
+        from converters import WordCache, dv_converter
+        cache = WordCache(maxsize=2)
+        self.assertEqual(cache.convert("क ख क", "dv"),
+                         dv_converter.convert("क ख क"))
+        self.assertEqual(cache.info("dv"), (1, 2, 0, 2, 2))
+        cache.convert("ग क", dv_converter)
+        self.assertEqual(cache.info("dv"), (2, 3, 1, 2, 2))
+        self.assertEqual(list(cache.words[dv_converter]), ["क", "ग"])
+        cache.convert("বাংলা", "bn")
+        self.assertEqual(cache.info("dv").currsize, 2)
+        self.assertEqual(cache.info(), (2, 4, 1, 2, 3))
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 2, 0))
+
+    def test_convert_deduplicated(self):
+        from converters import convert_deduplicated
+        from converters import convert_any_indic_to_braille, dv_converter
+        for text in TestBatch.TEXTS + ["क ्ष", "क\n्ष", "क ़्ष", "…  ्"]:
+            self.assertEqual(convert_deduplicated(text),
+                             convert_any_indic_to_braille(text))
+        text = (DV_SHIKSHAK_INPUT + " ्क्ष ...\n") * 20
+        self.assertEqual(convert_deduplicated(text, "dv"),
+                         dv_converter.convert(text))
+
+class TestAsync(unittest.TestCase):
+    def test_aconvert(self):
+        import asyncio
+        from converters import aconvert, convert_any_indic_to_braille
+        from converters import convert_devanagari_to_braille
+        text = (DV_SHIKSHAK_INPUT + ' "१+१"\n') * 20
+        self.assertEqual(asyncio.run(aconvert(text, chunk_size=100)),
+                         convert_any_indic_to_braille(text))
+        self.assertEqual(asyncio.run(aconvert(text, "dv", chunk_size=100)),
+                         convert_devanagari_to_braille(text))
+        for text in ("", "Non-indic text", "है ল"):
+            self.assertEqual(asyncio.run(aconvert(text)),
+                             convert_any_indic_to_braille(text))
+
+    def test_chunks(self):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        from converters import aconvert, convert_devanagari_to_braille
+        chunks = []
+        class Executor(ThreadPoolExecutor):
+            def submit(self, function, *args):
+                chunks.append(args[1])
+                return super().submit(function, *args)
+        # Short words, with the only newline near the end
+        text = "क " * 50000 + "\nख"
+        with Executor(max_workers=1) as executor:
+            self.assertEqual(asyncio.run(aconvert(text, "dv", executor,
+                                                  chunk_size=1000)),
+                             convert_devanagari_to_braille(text))
+        self.assertEqual(len(chunks), 100)
+        self.assertLess(max(len(chunk) for chunk in chunks), 2000)
+
+    def test_cancel(self):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        from converters import aconvert
+        chunks = []
+        class Executor(ThreadPoolExecutor):
+            def submit(self, function, *args):
+                chunks.append(args[1])
+                return super().submit(function, *args)
+        async def convert_and_cancel(executor):
+            task = asyncio.ensure_future(aconvert(DV_ACHARYA_INPUT * 20, "dv",
+                                                  executor, chunk_size=100))
+            # Let it start on the first chunk
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        with Executor(max_workers=1) as executor:
+            asyncio.run(convert_and_cancel(executor))
+        self.assertEqual(len(chunks), 1)
+
+class TestBrailleDocument(unittest.TestCase):
+    def test_edits(self):
+        from converters import BrailleDocument, convert_devanagari_to_braille
+        text = DV_ACHARYA_INPUT + "\n\n" + DV_SHIKSHAK_INPUT
+        document = BrailleDocument(text, "dv")
+        braille = document.braille
+        self.assertEqual((braille, document.warnings),
+                         convert_devanagari_to_braille(text))
+        middle = text.index("सुब्रज्योत्स्ना") + 3
+        for (start, end, new_text) in ((len(text) - 3, len(text), ' "'),
+                                       (0, 0, "क"), (middle, middle, "\n"),
+                                       (middle, middle + 1, "्"),
+                                       (5, 40, "अ\n\n१.५ ")):
+            text = text[:start] + new_text + text[end:]
+            (braille_start, braille_end, new_braille) = \
+                document.apply_edit(start, end, new_text)
+            braille = braille[:braille_start] + new_braille + \
+                      braille[braille_end:]
+            self.assertEqual(document.text, text)
+            self.assertEqual((document.braille, document.warnings),
+                             convert_devanagari_to_braille(text))
+            self.assertEqual(braille, document.braille)
+
+    def test_bad_edits(self):
+        from converters import BrailleDocument
+        document = BrailleDocument("क\nख", "dv")
+        for (start, end) in ((-1, 0), (2, 1), (0, 4)):
+            with self.assertRaises(ValueError):
+                document.apply_edit(start, end, "")
+        self.assertEqual(document.apply_edit(3, 3, "ग"), (2, 3, "⠨⠛"))
+
+class TestBackTranslation(unittest.TestCase):
+    def test_back_translate(self):
+        from back_translation import Ambiguity, back_translate
+        (text, ambiguities) = back_translate("⠈⠎⠈⠞⠗⠔ ⠐⠻ ⠲⠲ ⠼⠁⠠⠚⠚⠖", "dv")
+        self.assertEqual(text, "स्त्री \u095d ॥ 1,00!")
+        self.assertEqual([(ambiguity.offset, ambiguity.cells)
+                          for ambiguity in ambiguities],
+                         [(4, "⠗"), (10, "⠲⠲"), (13, "⠼⠁"), (15, "⠠⠚"),
+                          (17, "⠚"), (18, "⠖")])
+        self.assertEqual(ambiguities[1].candidates, ("॥", "।।"))
+        self.assertEqual(ambiguities[2].candidates[:2], ("1", "१"))
+        self.assertEqual(ambiguities[-1].candidates, ("!", "फ", "\u095e"))
+        # Only a vowel after a consonant gets an explicit schwa
+        self.assertEqual(back_translate("⠅⠁⠊ ⠁⠊", "dv"),
+                         ("कइ अइ", [Ambiguity(0, "⠅", ("क", "\u0958")),
+                                    Ambiguity(1, "⠁⠊", ("इ", "अइ"))]))
+        # Cells that stand for nothing are kept
+        self.assertEqual(back_translate("⠋", "dv"),
+                         ("⠋", [Ambiguity(0, "⠋", ())]))
+
+    def test_verify(self):
+        from back_translation import BackTranslator
+        from converters import convert_devanagari_to_braille
+        back_translator = BackTranslator("dv")
+        braille = convert_devanagari_to_braille("क\u093cलम")[0]
+        for text in ("क\u093cलम", "\u0958लम", "कलम"):
+            self.assertIsNone(back_translator.verify(text, braille))
+        self.assertEqual(back_translator.verify("कम", braille), (1, 1))
+        self.assertEqual(back_translator.verify("कल", braille), (2, 2))
+        # Not read as क्ष, which has cells of its own
+        braille = convert_devanagari_to_braille("\u0958्ष")[0]
+        self.assertEqual(back_translator.verify("क्ष", braille), (2, 2))
+        braille = convert_devanagari_to_braille("सत्री ५")[0]
+        self.assertIsNone(back_translator.verify("सत्री णे", braille))
+        self.assertEqual(back_translator.verify("स्त्री ५", braille), (1, 2))
+
+    def test_round_trips(self):
+        from back_translation import BackTranslator, verify_round_trips
+        texts = [DV_ACHARYA_INPUT, DV_SHIKSHAK_INPUT, "१.५, 2...", "ि"]
+        self.assertEqual([index for (index, _) in
+                          verify_round_trips(texts, "dv")], [3])
+        self.assertEqual(verify_round_trips(["বাংলা", "ক্ষমা"], "bn"), [])
+        # A silent character keeps a consonant and a vowel letter apart, so
+        # there is no schwa between them; a vowel sign still follows
+        self.assertEqual(verify_round_trips(["ક઼ઈ", "ક઼ા"], "gu"), [])
+        self.assertIsNone(BackTranslator("te").verify("తఽఎ", "⠞⠢"))
+        self.assertEqual(BackTranslator("gu").verify("ક઼ઈ", "⠅⠁⠔"), (2, 1))
+
+class TestConversionStats(unittest.TestCase):
+    def test_stats(self):
+        from converters import ConversionStats, convert_any_indic_to_braille
+        from converters import convert_mixed_indic_to_braille
+        stats = ConversionStats()
+        text = DV_SHIKSHAK_INPUT + ' "२+२" ...'
+        self.assertEqual(convert_any_indic_to_braille(text, stats=stats),
+                         convert_any_indic_to_braille(text))
+        self.assertEqual(list(stats.stages),
+                         ["detect", "nukta", "schwa", "composites",
+                          "charset", "virama", "math", "common_glyphs",
+                          "warnings"])
+        self.assertEqual(stats.stages["schwa"].calls, 1)
+        self.assertEqual(stats.stages["schwa"].chars_in, len(text))
+        self.assertEqual(stats.stages["schwa"].chars_out,
+                         stats.stages["composites"].chars_in)
+        text = "हिंदी বাংলা"
+        self.assertEqual(convert_mixed_indic_to_braille(text, stats=stats),
+                         convert_mixed_indic_to_braille(text))
+        self.assertEqual(stats.stages["schwa"].calls, 3)
+        self.assertEqual(stats.stages["detect"].calls, 2)
+        self.assertTrue(stats.report().startswith("stage"))
+
+    def test_stats_with_other_options(self):
+        import contextlib
+        import io
+        from converters import ConversionStats, dv_converter
+        stats = ConversionStats()
+        (timed, plain) = (io.StringIO(), io.StringIO())
+        with contextlib.redirect_stdout(timed):
+            dv_converter.convert(DV_SHIKSHAK_INPUT, True, stats)
+        with contextlib.redirect_stdout(plain):
+            dv_converter.convert(DV_SHIKSHAK_INPUT, True)
+        self.assertEqual(timed.getvalue(), plain.getvalue())
+        self.assertEqual(stats.stages["common_glyphs"].calls, 1)
+        with self.assertRaises(TypeError):
+            dv_converter.convert(DV_SHIKSHAK_INPUT, stats=stats, offsets=True)
+
+class TestParallel(unittest.TestCase):
+    def test_split_text(self):
+        from converters import split_text
+        self.assertEqual(split_text("ab cd\nef gh ij", 3),
+                         ["ab cd", "\nef", " gh", " ij"])
+        self.assertEqual(split_text("abcdef", 2), ["abcdef"])
+        self.assertEqual(split_text("", 2), [""])
+        # A newline far away is not waited for
+        text = "ab " * 10000 + "\ncd"
+        pieces = split_text(text, 100)
+        self.assertEqual(''.join(pieces), text)
+        self.assertEqual(len(pieces), 295)
+        self.assertLess(max(len(piece) for piece in pieces), 200)
+
+    def test_convert_parallel(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from converters import convert_parallel, convert_any_indic_to_braille
+        from converters import dv_converter
+        text = (DV_SHIKSHAK_INPUT + ' "२+२" ्क्ष ...\n') * 20
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(convert_parallel(text, shard_size=100,
+                                              executor=executor),
+                             convert_any_indic_to_braille(text))
+        self.assertEqual(convert_parallel(text, "dv", workers=2,
+                                          shard_size=1000),
+                         dv_converter.convert(text))
+
+    def test_convert_parallel_custom_plan(self):
+        import pickle
+        from converters import convert_parallel, dv_converter
+        from converters import ScriptConverter, script_converters
+        plan = ScriptConverter(dv_converter.schwa, dv_converter.virama,
+                               dv_converter.all_consonants,
+                               dv_converter.vowel_chars,
+                               dv_converter.indic_to_bb,
+                               dv_converter.indic_to_bb_composite,
+                               "custom dv")
+        self.assertNotIn(plan.name, script_converters)
+        text = (DV_SHIKSHAK_INPUT + ' "२+२" ्क्ष ...\n') * 20
+        self.assertEqual(pickle.loads(pickle.dumps(plan)).convert(text),
+                         dv_converter.convert(text))
+        self.assertEqual(convert_parallel(text, plan, workers=2,
+                                          shard_size=1000),
+                         dv_converter.convert(text))
+
 class TestAutodetectConverter(unittest.TestCase):
     def test_none_detected(self):
         from converters import convert_any_indic_to_braille, BB_ERR_UNKNOWN_SCRIPT
         (text, warnings) = convert_any_indic_to_braille("Non-indic text")
         self.assertEqual(text, "")
-        self.assertEqual(warnings, BB_ERR_UNKNOWN_SCRIPT)
+        self.assertEqual(warnings[0].kind, BB_ERR_UNKNOWN_SCRIPT)
 
     def test_multiple_detected(self):
         from converters import convert_any_indic_to_braille, BB_ERR_MANY_SCRIPTS
         (text, warnings) = convert_any_indic_to_braille("है ল")
         self.assertEqual(text, "")
-        self.assertEqual(warnings, BB_ERR_MANY_SCRIPTS)
+        self.assertEqual(warnings[0].kind, BB_ERR_MANY_SCRIPTS)
+
+    def test_script_runs(self):
+        from converters import script_detector, dv_converter, bn_converter
+        text = "“हिंदी” 12, বাংলা। और"
+        runs = script_detector.detect(text)
+        self.assertEqual([(run.script, run.start, run.end) for run in runs],
+                         [(dv_converter, 0, 12), (bn_converter, 12, 19),
+                          (dv_converter, 19, 21)])
+        runs = script_detector.detect(text, limit=2)
+        self.assertEqual([(run.script, run.start, run.end) for run in runs],
+                         [(dv_converter, 0, 12), (bn_converter, 12, None)])
+        self.assertEqual(script_detector.detect("12, abc"), [])
+
+    def test_mixed_scripts(self):
+        from converters import convert_mixed_indic_to_braille
+        from converters import convert_any_indic_to_braille
+        from converters import convert_devanagari_to_braille
+        from converters import convert_bengali_to_braille
+        from converters import BB_ERR_UNKNOWN_SCRIPT, BB_WARN_DUMB_QUOTES
+        from converters import ConversionWarning
+        (text, warnings) = convert_mixed_indic_to_braille(
+            "वह बोली, “আমার সোনার বাংলা”। और \"चली\"")
+        self.assertEqual(text,
+            convert_devanagari_to_braille("वह बोली, “")[0] +
+            convert_bengali_to_braille("আমার সোনার বাংলা”। ")[0] +
+            convert_devanagari_to_braille("और \"चली\"")[0])
+        self.assertEqual(warnings,
+                         [ConversionWarning(BB_WARN_DUMB_QUOTES,
+                                            text.index('"'), 2)])
+        self.assertEqual(convert_mixed_indic_to_braille(DV_SHIKSHAK_INPUT),
+                         convert_any_indic_to_braille(DV_SHIKSHAK_INPUT))
+        self.assertEqual(convert_mixed_indic_to_braille("Non-indic text"),
+                         ("", [ConversionWarning(BB_ERR_UNKNOWN_SCRIPT,
+                                                 None, 1)]))
 
     def test_bengali_detected(self):
         from converters import convert_any_indic_to_braille
         input_text = "বাংলা"
         (text, warnings) = convert_any_indic_to_braille(input_text)
-        self.assertEqual(warnings, "")
+        self.assertEqual(warnings, [])
         self.assertNotEqual(text, input_text)
 
     def test_devanagari_detected(self):
         from converters import convert_any_indic_to_braille
         input_text = "देवनागरी"
         (text, warnings) = convert_any_indic_to_braille(input_text)
-        self.assertEqual(warnings, "")
+        self.assertEqual(warnings, [])
         self.assertNotEqual(text, input_text)
 
     def test_gujarati_detected(self):
         from converters import convert_any_indic_to_braille
         input_text = "ગુજરાતી"
         (text, warnings) = convert_any_indic_to_braille(input_text)
-        self.assertEqual(warnings, "")
+        self.assertEqual(warnings, [])
         self.assertNotEqual(text, input_text)
 
     def test_telugu_detected(self):
         from converters import convert_any_indic_to_braille
         input_text = "తెలుగు"
         (text, warnings) = convert_any_indic_to_braille(input_text)
-        self.assertEqual(warnings, "")
+        self.assertEqual(warnings, [])
         self.assertNotEqual(text, input_text)
 
     def test_tamil_detected(self):
         from converters import convert_any_indic_to_braille
         input_text = "தமிழ்"
         (text, warnings) = convert_any_indic_to_braille(input_text)
-        self.assertEqual(warnings, "")
+        self.assertEqual(warnings, [])
         self.assertNotEqual(text, input_text)
 
 if __name__ == "__main__":
@@ -3,20 +3,37 @@ import sys
 
 from bottle import route, run, get, request, static_file, template
 from backend.converters import convert_any_indic_to_braille
+from backend.converters import BB_WARN_DUMB_QUOTES, BB_WARN_MATH_OPS
+from backend.converters import BB_ERR_UNKNOWN_SCRIPT, BB_ERR_MANY_SCRIPTS
 
 if sys.version_info.major != 3:
     raise Exception("This program needs Python 3!")
 
+BB_WARN_WRAPPER = """<p class="warning">{0}</p>\n"""
+BB_WARN_MESSAGES = {
+    BB_WARN_DUMB_QUOTES: """The convertor does not handle <a href="about.html#conv_limitations">dumb quotes</a>.""",
+    BB_WARN_MATH_OPS: """The convertor does not handle <a href="about.html#conv_limitations">mathematical operators</a>.""",
+    # XXX: Link to contribute page?
+    BB_ERR_UNKNOWN_SCRIPT: """Unable to convert to Bharati Braille: Unknown script.""",
+    # TODO: Link to Bharati Braille limitation concerning multi-script text
+    BB_ERR_MANY_SCRIPTS: """Unable to convert to Bharati Braille: Multiple scripts in input.""",
+}
+
+def render_warnings(warnings):
+    "Returns the HTML for the ConversionWarnings of a conversion"
+    return "".join([BB_WARN_WRAPPER.format(BB_WARN_MESSAGES[warning.kind])
+                    for warning in warnings])
+
 @route("/", method=["POST", "GET"])
 def index():
     input_text = request.forms.devanagari
-    (braille, warnings) = ("", "")
+    (braille, warnings) = ("", [])
     if input_text:
         (braille, warnings) = convert_any_indic_to_braille(input_text)
     return template("index", 
                     input_text=input_text,
                     braille=braille,
-                    warnings=warnings)
+                    warnings=render_warnings(warnings))
 
 @get("/<filetype:re:(js|static)>/<filepath:path>")
 def server_static(filetype, filepath):